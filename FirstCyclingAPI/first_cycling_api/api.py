@@ -6,16 +6,32 @@ Provides tools to access the FirstCycling API.
 """
 
 from slumber import API
-from bs4 import BeautifulSoup
 import re
 import requests
 import urllib.parse
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+
+REQUEST_TIMEOUT = 10
+""" Seconds to wait for firstcycling.com before giving up on a request. """
+
+def _build_session():
+    """ Create a session whose connection pool keeps connections to firstcycling.com alive between requests. """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 class FirstCyclingAPI(API):
     """ Wrapper for FirstCycling API """
-    def __init__(self):
-        super().__init__("https://firstcycling.com", append_slash=False)
+    def __init__(self, session=None):
+        super().__init__("https://firstcycling.com", append_slash=False, session=session or _build_session())
+
+    @property
+    def session(self):
+        """ The requests session shared by every call to firstcycling.com. """
+        return self._store['session']
         
     def __getitem__(self, key):
         return getattr(self, key)
@@ -24,7 +40,7 @@ class FirstCyclingAPI(API):
         return {k: v for k, v in kwargs.items() if v}
     
     def _get_resource_response(self, resource, **kwargs):
-        return self._store['session'].get(resource.url(), params=self._fix_kwargs(**kwargs)).content
+        return self.session.get(resource.url(), params=self._fix_kwargs(**kwargs), timeout=REQUEST_TIMEOUT).content
 
     def get_rider_endpoint(self, rider_id, **kwargs):
         return self._get_resource_response(self['rider.php'], r=rider_id, **kwargs)
@@ -7,7 +7,6 @@ Provides classes for API objects.
 
 import bs4
 import json
-import pandas as pd
 import datetime
 
 
@@ -35,11 +34,30 @@ class Endpoint:
 
 class ParsedEndpoint(Endpoint):
 	def __init__(self, response):
+		self._soup = None
+		self._keep_soup = True
 		super().__init__(response)
 		self._parse_result()
 
+	@property
+	def soup(self):
+		""" BeautifulSoup tree of the response, built on first use. """
+		if self._soup is not None:
+			return self._soup
+		soup = bs4.BeautifulSoup(self.response, 'lxml')
+		if self._keep_soup:
+			self._soup = soup
+		return soup
+
+	def drop_soup(self):
+		"""
+		Release the parsed tree and stop keeping it, e.g. for endpoints held in a cache.
+		Later uses of ``soup`` build a fresh tree from the response.
+		"""
+		self._soup = None
+		self._keep_soup = False
+
 	def _parse_result(self):
-		self.soup = bs4.BeautifulSoup(self.response, 'html.parser')
 		self._parse_soup()
 	def _parse_soup(self):
 		return
@@ -50,6 +68,8 @@ def ComplexHandler(obj):
 	Customized handler to convert object to JSON by recursively calling to_json() method.
 	Adapted from https://stackoverflow.com/questions/5160077/encoding-nested-python-object-in-json
 	""" 
+	import pandas as pd
+
 	if hasattr(obj, '_to_json'):
 		return obj._to_json()
 	elif isinstance(obj, datetime.date):
@@ -235,7 +235,7 @@ def search_race_id(query, html, threshold=0.7):
     Returns:
         int of None: Het race-ID als er een match is, anders None.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     norm_query = normalize(query)
     matches = []
     
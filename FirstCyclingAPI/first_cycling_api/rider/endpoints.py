@@ -1,7 +1,6 @@
 from ..endpoints import ParsedEndpoint
 from ..parser import parse_date, parse_table, team_link_to_id, img_to_country_code, link_to_twitter_handle
 
-import pandas as pd
 import bs4
 import io
 
@@ -105,6 +104,8 @@ class RiderVictories(RiderEndpoint):
 		self._get_victories()
 
 	def _get_victories(self):
+		import pandas as pd
+
 		# Find table with victories
 		table = self.soup.find('table', {'class': "sortTabell tablesorter"})
 		if table:
@@ -198,6 +199,8 @@ class RiderBestResults(RiderEndpoint):
 		self._get_best_results()
 
 	def _get_best_results(self):
+		import pandas as pd
+
 		# Find table with best results (note different class than victories table)
 		table = self.soup.find('table', {'class': "tablesorter"})
 		if table:
@@ -294,6 +297,8 @@ class RiderMonumentResults(RiderEndpoint):
 		self._get_monument_results()
 
 	def _get_monument_results(self):
+		import pandas as pd
+
 		# Find table with monument results - first try with both classes
 		table = self.soup.find('table', {'class': "tablesorter sortTabell"}) 
 		
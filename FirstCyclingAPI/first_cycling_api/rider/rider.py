@@ -1,12 +1,13 @@
 from ..objects import FirstCyclingObject
 from .endpoints import RiderEndpoint, RiderYearResults, RiderVictories, RiderBestResults, RiderMonumentResults
-from ..api import fc
-import requests
+from ..api import fc, REQUEST_TIMEOUT
 from bs4 import BeautifulSoup
 import re
 import difflib
+import functools
 from typing import List, Dict, Any, Optional
 
+@functools.lru_cache(maxsize=4096)
 def normalize(text):
 	"""
 	Normalize rider names for better matching.
@@ -25,6 +26,7 @@ def normalize(text):
 	
 	return text
 
+@functools.lru_cache(maxsize=4096)
 def soundex(name):
 	"""
 	Simplified implementation of Soundex algorithm, which converts a name into a code
@@ -71,6 +73,7 @@ def soundex(name):
 	
 	return result
 	
+@functools.lru_cache(maxsize=4096)
 def calculate_similarity(query, name):
 	"""
 	Calculate similarity between a search query and a rider name,
@@ -88,7 +91,10 @@ def calculate_similarity(query, name):
 	norm_name = normalize(name)
 	
 	# Basic similarity using sequence matcher
-	basic_similarity = difflib.SequenceMatcher(None, norm_query, norm_name).ratio()
+	# SequenceMatcher indexes its second sequence, so each matcher below indexes one name
+	# string once and compares every query string against it via set_seq1
+	matcher = difflib.SequenceMatcher(None, norm_query, norm_name)
+	basic_similarity = matcher.ratio()
 	
 	# Split into parts and try different combinations
 	query_parts = norm_query.split()
@@ -103,19 +109,18 @@ def calculate_similarity(query, name):
 	
 	# Compare each query part against the full name
 	for q_part in query_parts:
-		part_sim = difflib.SequenceMatcher(None, q_part, norm_name).ratio()
-		part_similarities.append(part_sim)
+		matcher.set_seq1(q_part)
+		part_similarities.append(matcher.ratio())
 	
-	# Compare full query against each name part
 	for n_part in name_parts:
-		part_sim = difflib.SequenceMatcher(None, norm_query, n_part).ratio()
-		part_similarities.append(part_sim)
-	
-	# Compare all parts combinations (to handle first/last name variations)
-	for q_part in query_parts:
-		for n_part in name_parts:
-			part_sim = difflib.SequenceMatcher(None, q_part, n_part).ratio()
-			part_similarities.append(part_sim)
+		# Compare full query against each name part
+		part_matcher = difflib.SequenceMatcher(None, norm_query, n_part)
+		part_similarities.append(part_matcher.ratio())
+		
+		# Compare all parts combinations (to handle first/last name variations)
+		for q_part in query_parts:
+			part_matcher.set_seq1(q_part)
+			part_similarities.append(part_matcher.ratio())
 	
 	# Get the best part similarity
 	best_part_sim = max(part_similarities) if part_similarities else 0
@@ -124,14 +129,11 @@ def calculate_similarity(query, name):
 	soundex_boost = 0
 	
 	# Apply Soundex to each part combination to handle phonetic variations
+	name_soundexes = {soundex(n_part) for n_part in name_parts}
 	for q_part in query_parts:
 		q_soundex = soundex(q_part)
-		for n_part in name_parts:
-			n_soundex = soundex(n_part)
-			if q_soundex == n_soundex and q_soundex:  # Exact Soundex match
-				soundex_boost = 0.4  # Significant boost for phonetic matches
-				break
-		if soundex_boost > 0:
+		if q_soundex and q_soundex in name_soundexes:  # Exact Soundex match
+			soundex_boost = 0.4  # Significant boost for phonetic matches
 			break
 	
 	# Combine different matching approaches for final score
@@ -179,8 +181,8 @@ class Rider(FirstCyclingObject):
 		url = f"{cls.base_url}/search.php?s={query}"
 		
 		try:
-			response = requests.get(url)
-			soup = BeautifulSoup(response.text, 'html.parser')
+			response = fc.session.get(url, timeout=REQUEST_TIMEOUT)
+			soup = BeautifulSoup(response.text, 'lxml')
 			
 			# Find all tables with the rider results
 			tables = soup.find_all('table')
@@ -407,8 +409,8 @@ class Rider(FirstCyclingObject):
 
 	@classmethod
 	def profile(cls, rider_id: int) -> Dict[str, Any]:
-		response = requests.get(f"{cls.base_url}/rider.php?r={rider_id}")
-		soup = BeautifulSoup(response.text, 'html.parser')
+		response = fc.session.get(f"{cls.base_url}/rider.php?r={rider_id}", timeout=REQUEST_TIMEOUT)
+		soup = BeautifulSoup(response.text, 'lxml')
 
 		# Basic Info
 		profile = {}
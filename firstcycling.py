@@ -1,26 +1,208 @@
 from typing import Any
 import sys
 import os
+import io
+import asyncio
+import functools
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from operator import itemgetter
 from mcp.server.fastmcp import FastMCP
 import requests
-from bs4 import BeautifulSoup
+import lxml.etree
 from typing import Dict, List, Optional, Union
 from datetime import datetime
-from FirstCyclingAPI.first_cycling_api.rider.rider import Rider
-from FirstCyclingAPI.first_cycling_api.race.race import Race
-from FirstCyclingAPI.first_cycling_api.api import FirstCyclingAPI
+from html import unescape
 import re
 
 # Add the FirstCyclingAPI directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), "FirstCyclingAPI"))
 
-# Import from the FirstCycling API
+# Import from the FirstCycling API, through one package path only so its modules load once
 from first_cycling_api.rider.rider import Rider
-from first_cycling_api.race.race import RaceEdition
+from first_cycling_api.race.race import Race
+from first_cycling_api.ranking.ranking import Ranking
+from first_cycling_api.api import fc, REQUEST_TIMEOUT
+
+from firstcycling_parsers import (
+    parse_rider_info_html,
+    parse_grand_tour_html,
+    parse_race_history_html,
+    parse_race_results_html,
+)
 
 # Initialize FastMCP server
 mcp = FastMCP("firstcycling")
 
+# Direct page fetches share the API's pooled session, so they reuse its keep-alive connections
+_SESSION = fc.session
+_REQUEST_TIMEOUT = REQUEST_TIMEOUT
+
+def _ttl_cache(maxsize=1024, ttl=3600):
+    """Cache a function's results per argument tuple for ``ttl`` seconds.
+
+    At most ``maxsize`` entries are kept, evicting the least recently used.
+    Exceptions are not cached, so a transient network error is retried on
+    the next call. Cached values are shared between callers and must not be
+    mutated.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return entry[1]
+            value = func(*args, **kwargs)
+            with lock:
+                cache[key] = (time.monotonic() + ttl, value)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+@functools.lru_cache(maxsize=512)
+def _get_rider(rider_id):
+    """Return a shared Rider instance for ``rider_id``."""
+    return Rider(rider_id)
+
+class _RiderPageError(Exception):
+    """A rider page that the FirstCyclingAPI parsers could not read."""
+
+# Rider pages change on race-day cadence, so parsed endpoints are reused for an hour.
+# Within that window a rider tool may not show results added to FirstCycling since the first fetch.
+@_ttl_cache(maxsize=1024, ttl=3600)
+def _fetch_rider(rider_id, method, *args, **kwargs):
+    """Fetch and parse a rider endpoint, e.g. ``_fetch_rider(16973, 'best_results')``."""
+    fetch = getattr(_get_rider(rider_id), method)
+    try:
+        endpoint = fetch(*args, **kwargs)
+    except AttributeError as e:
+        # The library's header parsing dereferences page elements that are missing when
+        # the page has no rider layout, e.g. for an unknown rider ID
+        raise _RiderPageError(f"rider ID {rider_id} has no {method} page to parse") from e
+    # A page's soup is tens of times the size of its bytes, so only the raw response and
+    # parsed fields stay cached. Rider names are read from the response; only the
+    # table-walking fallbacks rebuild the soup on demand
+    endpoint.drop_soup()
+    return endpoint
+
+@_ttl_cache(maxsize=256, ttl=3600)
+def _search_riders(query):
+    """Run ``Rider.search`` for an already normalized query."""
+    riders = Rider.search(query)
+    if not riders:
+        # Rider.search also returns [] when the request fails, so empty results are never cached
+        raise LookupError(query)
+    return riders
+
+# Errors a rider tool reports back as text: network failures, and pages whose
+# layout does not match what the parsers expect. Anything else is a bug and propagates.
+_FETCH_ERRORS = (
+    requests.RequestException,
+    lxml.etree.LxmlError,
+    _RiderPageError,
+)
+
+# A four-digit year, e.g. in "2023" or "01.01.2023"
+_YEAR_RE = re.compile(r'\d{4}')
+
+# Column header keywords and line format for each UCI ranking type.
+# Columns are listed in table order, which is also the fallback index when a header is missing.
+_RANK_SPEC = {
+    "riders": (
+        (("Rank", "Pos"), ("Rider", "Name"), ("Team",), ("Points",)),
+        lambda c: f"{c[0]}. {c[1]} ({c[2]}): {c[3]} pts",
+    ),
+    "teams": (
+        (("Rank", "Pos"), ("Team",), ("Points",)),
+        lambda c: f"{c[0]}. {c[1]}: {c[2]} pts",
+    ),
+    "nations": (
+        (("Rank", "Pos"), ("Nation", "Country"), ("Points",)),
+        lambda c: f"{c[0]}. {c[1]}: {c[2]} pts",
+    ),
+}
+
+# Day-first dates as shown in race tables, e.g. "22.04" or "22.04.2012"
+_DAY_FIRST_DATE_RE = re.compile(r'^(\d{1,2})\.(\d{1,2})')
+
+def _date_sort_key(column):
+    """Sort key for race tables that orders day-first ``Date`` values by month, then day."""
+    if column.name != 'Date':
+        return column
+    return column.astype(str).str.replace(
+        _DAY_FIRST_DATE_RE, lambda m: f"{int(m[2]):02d}.{int(m[1]):02d}", regex=True
+    )
+
+def _has_results(endpoint):
+    """Return True if a parsed endpoint carries a non-empty results table."""
+    results_df = getattr(endpoint, 'results_df', None)
+    return results_df is not None and not results_df.empty
+
+# Page <title> text before the first "|", e.g. "Tadej Pogačar | FirstCycling"
+_TITLE_NAME_RE = re.compile(rb'<title[^>]*>([^|<]*)\|', re.IGNORECASE)
+
+def _rider_name_from_html(page):
+    """Return the rider name from a raw page's ``<title>``, or None.
+
+    The raw response bytes are searched directly, so no soup is walked.
+    """
+    match = _TITLE_NAME_RE.search(page) if page else None
+    if match is None:
+        return None
+    return unescape(match.group(1).decode('utf-8', 'replace')).strip() or None
+
+def _rider_name(endpoint):
+    """Return the rider name of a parsed endpoint, or None.
+
+    ``header_details`` is used when it carries the name; otherwise the name is
+    read from the raw page's ``<title>``.
+    """
+    header_details = getattr(endpoint, 'header_details', None)
+    if header_details and 'name' in header_details:
+        return header_details['name']
+    return _rider_name_from_html(getattr(endpoint, 'response', None))
+
+def _column_indices(headers, keyword_groups, defaults=None):
+    """Locate columns by header keywords in a single pass over the headers.
+
+    Each group in ``keyword_groups`` is a tuple of substrings; the first header
+    containing any of them gives that group's index. Groups with no matching
+    header take the matching entry of ``defaults``, or None.
+    """
+    indices = list(defaults) if defaults is not None else [None] * len(keyword_groups)
+    found = [False] * len(keyword_groups)
+    for i, header in enumerate(headers):
+        for g, keywords in enumerate(keyword_groups):
+            if not found[g] and any(k in header for k in keywords):
+                indices[g] = i
+                found[g] = True
+    return indices
+
+def _row_texts(row):
+    """Return the stripped text of each cell in a table row.
+
+    Only the row's direct ``<td>`` children are visited, so links and spans
+    inside the cells are never searched for nested cells.
+    """
+    return [td.get_text().strip() for td in row.find_all('td', recursive=False)]
+
 @mcp.tool(
     name="get_rider_year_results",
     description="""Retrieve detailed results for a professional cyclist for a specific year.
@@ -47,14 +229,11 @@ async def get_rider_year_results(rider_id: int, year: int) -> str:
         year: The year to get results for (e.g., 2023)
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get year results
-        year_results = rider.year_results(year)
+        year_results = await asyncio.to_thread(_fetch_rider, rider_id, 'year_results', year)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
         rider_name = None
@@ -62,20 +241,17 @@ async def get_rider_year_results(rider_id: int, year: int) -> str:
             if 'name' in year_results.header_details:
                 rider_name = year_results.header_details['name']
             else:
-                # Try to find name in soup
-                if hasattr(year_results, 'soup') and year_results.soup:
-                    name_element = year_results.soup.find('h1')
-                    if name_element:
-                        rider_name = name_element.text.strip()
+                # Read the name from the raw page, so a cached endpoint never rebuilds its soup
+                rider_name = _rider_name_from_html(year_results.response)
         
         # Format title
         if rider_name:
-            info += f"{year} Results for {rider_name}:\n\n"
+            parts.append(f"{year} Results for {rider_name}:\n\n")
         else:
-            info += f"{year} Results for Rider ID {rider_id}:\n\n"
+            parts.append(f"{year} Results for Rider ID {rider_id}:\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(year_results, 'results_df') and not (year_results.results_df is None or year_results.results_df.empty):
+        if _has_results(year_results):
             # Use standard parsing
             results_df = year_results.results_df
             
@@ -94,14 +270,13 @@ async def get_rider_year_results(rider_id: int, year: int) -> str:
                     result_line += f" ({category})"
                 result_line += f": {pos}"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
         else:
             # Direct HTML parsing
-            if not hasattr(year_results, 'soup') or not year_results.soup:
+            soup = getattr(year_results, 'soup', None)
+            if not soup:
                 return f"No results found for rider ID {rider_id} in year {year}. This rider ID may not exist or the rider didn't compete this year."
             
-            soup = year_results.soup
-            
             # Find results table
             results_table = None
             tables = soup.find_all('table')
@@ -146,12 +321,12 @@ async def get_rider_year_results(rider_id: int, year: int) -> str:
                     result_line += f" ({category})"
                 result_line += f": {pos}"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
         
-        if not info.endswith("\n\n"):
-            info += "\n"
+        if not "".join(parts[-2:]).endswith("\n\n"):
+            parts.append("\n")
             
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving {year} results for rider ID {rider_id}: {str(e)}"
 
@@ -181,14 +356,11 @@ async def get_rider_victories(rider_id: int, world_tour_only: bool = False) -> s
         world_tour_only: If True, only shows WorldTour victories
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get victories (UCI victories by default)
-        victories = rider.victories(world_tour=world_tour_only, uci=True)
+        victories = await asyncio.to_thread(_fetch_rider, rider_id, 'victories', world_tour=world_tour_only, uci=True)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
         rider_name = None
@@ -196,26 +368,23 @@ async def get_rider_victories(rider_id: int, world_tour_only: bool = False) -> s
             if 'name' in victories.header_details:
                 rider_name = victories.header_details['name']
             else:
-                # Try to find name in soup
-                if hasattr(victories, 'soup') and victories.soup:
-                    name_element = victories.soup.find('h1')
-                    if name_element:
-                        rider_name = name_element.text.strip()
+                # Read the name from the raw page, so a cached endpoint never rebuilds its soup
+                rider_name = _rider_name_from_html(victories.response)
         
         # Format title based on filter
         if rider_name:
             if world_tour_only:
-                info += f"WorldTour Victories for {rider_name}:\n\n"
+                parts.append(f"WorldTour Victories for {rider_name}:\n\n")
             else:
-                info += f"UCI Victories for {rider_name}:\n\n"
+                parts.append(f"UCI Victories for {rider_name}:\n\n")
         else:
             if world_tour_only:
-                info += f"WorldTour Victories for Rider ID {rider_id}:\n\n"
+                parts.append(f"WorldTour Victories for Rider ID {rider_id}:\n\n")
             else:
-                info += f"UCI Victories for Rider ID {rider_id}:\n\n"
+                parts.append(f"UCI Victories for Rider ID {rider_id}:\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(victories, 'results_df') and not (victories.results_df is None or victories.results_df.empty):
+        if _has_results(victories):
             # Use standard parsing
             results_df = victories.results_df
             
@@ -224,7 +393,7 @@ async def get_rider_victories(rider_id: int, world_tour_only: bool = False) -> s
             
             for year in results_df['Year'].unique():
                 year_data = results_df[results_df['Year'] == year]
-                info += f"{year}:\n"
+                parts.append(f"{year}:\n")
                 
                 for _, row in year_data.iterrows():
                     date = row.get('Date', 'N/A')
@@ -235,16 +404,15 @@ async def get_rider_victories(rider_id: int, world_tour_only: bool = False) -> s
                     if category and category != 'N/A':
                         result_line += f" ({category})"
                     
-                    info += result_line + "\n"
+                    parts.append(result_line + "\n")
                 
-                info += "\n"
+                parts.append("\n")
         else:
             # Direct HTML parsing
-            if not hasattr(victories, 'soup') or not victories.soup:
+            soup = getattr(victories, 'soup', None)
+            if not soup:
                 return f"No victories data found for rider ID {rider_id}. This rider ID may not exist or has no recorded victories."
             
-            soup = victories.soup
-            
             # Find victories table
             victories_table = None
             tables = soup.find_all('table')
@@ -274,53 +442,55 @@ async def get_rider_victories(rider_id: int, world_tour_only: bool = False) -> s
             race_idx = next((i for i, h in enumerate(headers) if "Race" in h), 1)  # Default to second column
             cat_idx = next((i for i, h in enumerate(headers) if "CAT" in h), None)
             
-            # Extract and organize victories by year
-            victories_by_year = {}
+            # Resolve missing columns once: an index past any row's width takes the default
+            # through the same bounds check that guards short rows, so no per-cell None check is needed
+            year_idx, date_idx, cat_idx = (sys.maxsize if idx is None else idx for idx in (year_idx, date_idx, cat_idx))
+            
+            # Extract victories as (year, date, race, category) rows
+            victory_rows = []
             
             # Skip header row
             for row in rows[1:]:
                 cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
+                num_cols = len(cols)
+                if num_cols < 3:  # Ensure it's a data row
                     continue
                 
                 # Extract data
-                year = cols[year_idx].text.strip() if year_idx is not None and year_idx < len(cols) else "Unknown"
-                date = cols[date_idx].text.strip() if date_idx is not None and date_idx < len(cols) else "N/A"
-                race = cols[race_idx].text.strip() if race_idx is not None and race_idx < len(cols) else cols[1].text.strip()
-                category = cols[cat_idx].text.strip() if cat_idx is not None and cat_idx < len(cols) else "N/A"
+                year = cols[year_idx].text.strip() if year_idx < num_cols else "Unknown"
+                date = cols[date_idx].text.strip() if date_idx < num_cols else "N/A"
+                race = cols[race_idx].text.strip() if race_idx < num_cols else cols[1].text.strip()
+                category = cols[cat_idx].text.strip() if cat_idx < num_cols else "N/A"
                 
                 # If year not found in date column, try to extract from date
                 if year == "Unknown" and date != "N/A":
-                    year_match = re.search(r'(\d{4})', date)
+                    year_match = _YEAR_RE.search(date)
                     if year_match:
-                        year = year_match.group(1)
-                
-                if year not in victories_by_year:
-                    victories_by_year[year] = []
+                        year = year_match.group()
                 
-                victories_by_year[year].append({
-                    'date': date,
-                    'race': race,
-                    'category': category
-                })
+                # Years and categories repeat across many rows; interning shares one string per value
+                # and lets the year grouping compare by identity
+                victory_rows.append((sys.intern(year), date, race, sys.intern(category)))
             
-            # Sort years in descending order and format output
-            for year in sorted(victories_by_year.keys(), reverse=True):
-                info += f"{year}:\n"
+            # One stable sort puts the years in descending order and keeps the page order
+            # within each year, so groupby can walk the years without building a dict
+            victory_rows.sort(key=itemgetter(0), reverse=True)
+            for year, year_victories in itertools.groupby(victory_rows, key=itemgetter(0)):
+                parts.append(f"{year}:\n")
                 
-                for victory in victories_by_year[year]:
-                    result_line = f"  {victory['date']} - {victory['race']}"
-                    if victory['category'] and victory['category'] != 'N/A':
-                        result_line += f" ({victory['category']})"
+                for _, date, race, category in year_victories:
+                    result_line = f"  {date} - {race}"
+                    if category and category != 'N/A':
+                        result_line += f" ({category})"
                     
-                    info += result_line + "\n"
+                    parts.append(result_line + "\n")
                 
-                info += "\n"
+                parts.append("\n")
             
-            if not victories_by_year:
-                info += "No victories found.\n"
+            if not victory_rows:
+                parts.append("No victories found.\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving victories for rider ID {rider_id}: {str(e)}"
 
@@ -348,14 +518,11 @@ async def get_rider_teams(rider_id: int) -> str:
         rider_id: The FirstCycling rider ID (e.g., 12345 for Peter Sagan)
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get teams history
-        teams_history = rider.teams()
+        teams_history = await asyncio.to_thread(_fetch_rider, rider_id, 'teams')
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
         rider_name = None
@@ -363,20 +530,17 @@ async def get_rider_teams(rider_id: int) -> str:
             if 'name' in teams_history.header_details:
                 rider_name = teams_history.header_details['name']
             else:
-                # Try to find name in soup
-                if hasattr(teams_history, 'soup') and teams_history.soup:
-                    name_element = teams_history.soup.find('h1')
-                    if name_element:
-                        rider_name = name_element.text.strip()
+                # Read the name from the raw page, so a cached endpoint never rebuilds its soup
+                rider_name = _rider_name_from_html(teams_history.response)
         
         # Format title
         if rider_name:
-            info += f"Team History for {rider_name}:\n\n"
+            parts.append(f"Team History for {rider_name}:\n\n")
         else:
-            info += f"Team History for Rider ID {rider_id}:\n\n"
+            parts.append(f"Team History for Rider ID {rider_id}:\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(teams_history, 'results_df') and not (teams_history.results_df is None or teams_history.results_df.empty):
+        if _has_results(teams_history):
             # Use standard parsing
             results_df = teams_history.results_df
             
@@ -387,14 +551,13 @@ async def get_rider_teams(rider_id: int) -> str:
                 year = row.get('Year', 'N/A')
                 team = row.get('Team', 'N/A')
                 
-                info += f"{year}: {team}\n"
+                parts.append(f"{year}: {team}\n")
         else:
             # Direct HTML parsing
-            if not hasattr(teams_history, 'soup') or not teams_history.soup:
+            soup = getattr(teams_history, 'soup', None)
+            if not soup:
                 return f"No team history found for rider ID {rider_id}. This rider ID may not exist."
             
-            soup = teams_history.soup
-            
             # Find teams table
             teams_table = None
             tables = soup.find_all('table')
@@ -410,13 +573,14 @@ async def get_rider_teams(rider_id: int) -> str:
             if not teams_table:
                 # Try to find any table that might contain years and teams
                 for table in tables:
-                    rows = table.find_all('tr')
+                    # Only the header and first data row are needed to classify the table
+                    rows = table.find_all('tr', limit=2)
                     if len(rows) >= 2:  # At least a header and one data row
                         # Check first data row for year-like and team-like content
-                        cols = rows[1].find_all('td')
+                        cols = rows[1].find_all('td', limit=2)
                         if len(cols) >= 2:
                             # Check if first column contains a year
-                            if re.match(r'\d{4}', cols[0].text.strip()):
+                            if _YEAR_RE.match(cols[0].text.strip()):
                                 teams_table = table
                                 break
             
@@ -459,12 +623,12 @@ async def get_rider_teams(rider_id: int) -> str:
             teams_by_year.sort(key=lambda x: x['year'], reverse=True)
             
             for team_entry in teams_by_year:
-                info += f"{team_entry['year']}: {team_entry['team']}\n"
+                parts.append(f"{team_entry['year']}: {team_entry['team']}\n")
             
             if not teams_by_year:
-                info += "No team history found.\n"
+                parts.append("No team history found.\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving team history for rider ID {rider_id}: {str(e)}"
 
@@ -497,26 +661,31 @@ async def search_rider(query: str) -> str:
              - Current team
     """
     try:
-        # Search for riders using the Rider.search method
-        riders = Rider.search(query)
+        # Search for riders using the Rider.search method, reusing recent answers
+        # for the same query regardless of case and spacing
+        normalized_query = " ".join(query.lower().split())
+        try:
+            riders = await asyncio.to_thread(_search_riders, normalized_query)
+        except LookupError:
+            riders = []
         
         if not riders:
             return f"No riders found matching the query '{query}'."
         
         # Build results string
-        info = f"Found {len(riders)} riders matching '{query}':\n\n"
+        parts = [f"Found {len(riders)} riders matching '{query}':\n\n"]
         
         for rider in riders:
-            info += f"ID: {rider['id']}\n"
-            info += f"Name: {rider['name']}\n"
+            parts.append(f"ID: {rider['id']}\n")
+            parts.append(f"Name: {rider['name']}\n")
             if rider.get('nationality'):
-                info += f"Nationality: {rider['nationality'].upper()}\n"
+                parts.append(f"Nationality: {rider['nationality'].upper()}\n")
             if rider.get('team'):
-                info += f"Team: {rider['team']}\n"
-            info += "\n"
+                parts.append(f"Team: {rider['team']}\n")
+            parts.append("\n")
         
-        return info
-    except Exception as e:
+        return "".join(parts)
+    except _FETCH_ERRORS as e:
         return f"Error searching for riders: {str(e)}"
 
 @mcp.tool(
@@ -557,159 +726,86 @@ async def get_rider_info(rider_id: int) -> str:
         Exception: If the rider is not found or if there are connection issues.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Use direct HTML parsing approach to handle cases where the regular parsing fails
+        year_results = None
         try:
-            # Try to get rider year results using standard method
-            year_results = rider.year_results()
+            # Try to get rider year results using standard method, fetching the
+            # UCI victories alongside so both page loads overlap
+            year_results, victories = await asyncio.gather(
+                asyncio.to_thread(_fetch_rider, rider_id, 'year_results'),
+                asyncio.to_thread(_fetch_rider, rider_id, 'victories', uci=True),
+                return_exceptions=True,
+            )
+            if isinstance(year_results, Exception):
+                raise year_results
             
             # Check if results exist
-            if year_results is None or not hasattr(year_results, 'results_df') or year_results.results_df.empty:
-                raise Exception("No results found using standard method")
+            if not _has_results(year_results):
+                raise _RiderPageError("No results found using standard method")
             
             # Extract details from the response
             header_details = year_results.header_details
             sidebar_details = year_results.sidebar_details
             
             # Build rider information string
-            info = ""
+            parts = []
             
             # Add name from header details
             if header_details and 'name' in header_details:
-                info += f"Name: {header_details['name']}\n"
+                parts.append(f"Name: {header_details['name']}\n")
             else:
-                info += f"Rider ID: {rider_id}\n"
+                parts.append(f"Rider ID: {rider_id}\n")
             
             # Add team if available
             if header_details and 'current_team' in header_details:
-                info += f"Team: {header_details['current_team']}\n"
+                parts.append(f"Team: {header_details['current_team']}\n")
             
             # Add Twitter/social media if available
             if header_details and 'twitter_handle' in header_details:
-                info += f"Twitter: @{header_details['twitter_handle']}\n"
+                parts.append(f"Twitter: @{header_details['twitter_handle']}\n")
             
             # Add information from sidebar details
             if sidebar_details:
                 if 'Nationality' in sidebar_details:
-                    info += f"Nationality: {sidebar_details['Nationality']}\n"
+                    parts.append(f"Nationality: {sidebar_details['Nationality']}\n")
                 if 'Date of Birth' in sidebar_details:
-                    info += f"Date of Birth: {sidebar_details['Date of Birth']}\n"
+                    parts.append(f"Date of Birth: {sidebar_details['Date of Birth']}\n")
                 if 'UCI ID' in sidebar_details:
-                    info += f"UCI ID: {sidebar_details['UCI ID']}\n"
+                    parts.append(f"UCI ID: {sidebar_details['UCI ID']}\n")
             
             # Get results for current year
-            if hasattr(year_results, 'results_df') and not year_results.results_df.empty:
-                info += "\nRecent Results:\n"
-                results_count = min(5, len(year_results.results_df))
-                for i in range(results_count):
-                    row = year_results.results_df.iloc[i]
-                    date = row.get('Date', 'N/A')
-                    race = row.get('Race', 'N/A')
-                    pos = row.get('Pos', 'N/A')
-                    info += f"{i+1}. {date} - {race}: {pos}\n"
+            if _has_results(year_results):
+                parts.append("\nRecent Results:\n")
+                recent_results = (year_results.results_df.head(5)
+                                  .reindex(columns=['Date', 'Race', 'Pos'])
+                                  .fillna('N/A')
+                                  .astype(str))
+                # Build every result line with column-wise string concatenation
+                result_lines = recent_results['Date'] + ' - ' + recent_results['Race'] + ': ' + recent_results['Pos']
+                for i, line in enumerate(result_lines, 1):
+                    parts.append(f"{i}. {line}\n")
             
             # Add victories if available (just a count)
-            try:
-                victories = rider.victories(uci=True)
-                if hasattr(victories, 'results_df') and not victories.results_df.empty:
-                    info += f"\nUCI Victories: {len(victories.results_df)}\n"
-            except:
-                pass
+            if _has_results(victories):
+                parts.append(f"\nUCI Victories: {len(victories.results_df)}\n")
             
-            return info
+            return "".join(parts)
             
-        except Exception as parsing_error:
+        except _FETCH_ERRORS:
             # If standard parsing method fails, use direct HTML parsing
-            # Get raw HTML for the rider page
-            url = f"https://firstcycling.com/rider.php?r={rider_id}"
-            response = requests.get(url)
-            
-            if response.status_code != 200:
-                return f"Failed to retrieve data for rider ID {rider_id}. Status code: {response.status_code}"
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Check if the page indicates the rider doesn't exist
-            if "not found" in soup.text.lower() or "no results found" in soup.text.lower():
-                return f"Rider ID {rider_id} does not exist on FirstCycling.com."
-            
-            # Build rider information string
-            info = ""
-            
-            # Get rider name from the heading
-            name_element = soup.find('h1')
-            if name_element:
-                rider_name = name_element.text.strip()
-                info += f"Name: {rider_name}\n"
-            else:
-                info += f"Rider ID: {rider_id}\n"
-            
-            # Get current team - typically in a div after the rider name
-            team_element = soup.find('span', class_='blue')
-            if team_element:
-                team_name = team_element.text.strip()
-                info += f"Team: {team_name}\n"
-            
-            # Try to find the sidebar details (nationality, birth date, etc.)
-            sidebar = soup.find('div', class_='rp-info')
-            if sidebar:
-                detail_rows = sidebar.find_all('tr')
-                for row in detail_rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
-                        key = cells[0].text.strip().rstrip(':')
-                        value = cells[1].text.strip()
-                        if key and value:
-                            info += f"{key}: {value}\n"
-            
-            # Try to find recent results
-            tables = soup.find_all('table')
-            results_table = None
-            
-            # Look for a table that has race results
-            for table in tables:
-                headers = [th.text.strip() for th in table.find_all('th')]
-                if len(headers) >= 3 and ('Date' in headers or 'Race' in headers):
-                    results_table = table
-                    break
-            
-            if results_table:
-                # Get the headers to identify column positions
-                headers = [th.text.strip() for th in results_table.find_all('th')]
-                date_idx = headers.index('Date') if 'Date' in headers else None
-                race_idx = headers.index('Race') if 'Race' in headers else None
-                pos_idx = headers.index('Pos') if 'Pos' in headers else None
-                
-                if date_idx is not None and race_idx is not None and pos_idx is not None:
-                    # Extract up to 5 recent results
-                    rows = results_table.find_all('tr')[1:6]  # Skip header row, take up to 5 rows
-                    
-                    if rows:
-                        info += "\nRecent Results:\n"
-                        for i, row in enumerate(rows):
-                            cells = row.find_all('td')
-                            if len(cells) > max(date_idx, race_idx, pos_idx):
-                                date = cells[date_idx].text.strip()
-                                race = cells[race_idx].text.strip()
-                                pos = cells[pos_idx].text.strip()
-                                info += f"{i+1}. {date} - {race}: {pos}\n"
-            
-            # Try to find victories count
-            # This can be tricky with direct parsing, often in a different section
-            victories_section = soup.find(text=lambda text: text and 'victories' in text.lower())
-            if victories_section:
-                # Try to extract the number from text like "X UCI victories"
-                victory_text = victories_section.strip()
-                victory_match = re.search(r'(\d+)\s+UCI\s+victories', victory_text, re.IGNORECASE)
-                if victory_match:
-                    victories_count = victory_match.group(1)
-                    info += f"\nUCI Victories: {victories_count}\n"
-            
-            return info
-    except Exception as e:
+            # The standard method already downloaded the rider page, so reuse it when available
+            html = getattr(year_results, 'response', None)
+            if not html:
+                # Get raw HTML for the rider page
+                url = f"https://firstcycling.com/rider.php?r={rider_id}"
+                response = await asyncio.to_thread(_SESSION.get, url, timeout=_REQUEST_TIMEOUT)
+                
+                if response.status_code != 200:
+                    return f"Failed to retrieve data for rider ID {rider_id}. Status code: {response.status_code}"
+                html = response.content
+            
+            return parse_rider_info_html(html, rider_id)
+    except _FETCH_ERRORS as e:
         return f"Error retrieving rider information for ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
 @mcp.tool(
@@ -754,36 +850,29 @@ async def get_rider_best_results(rider_id: int, limit: int = 10) -> str:
         Exception: If the rider is not found or if there are connection issues.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get best results
-        best_results = rider.best_results()
+        best_results = await asyncio.to_thread(_fetch_rider, rider_id, 'best_results')
         
         # Check if results exist
-        if best_results is None or not hasattr(best_results, 'results_df') or best_results.results_df.empty:
+        if not _has_results(best_results):
             return f"No best results found for rider ID {rider_id}. Check if this rider has results on FirstCycling.com."
         
         # Build results information string
-        info = ""
+        parts = []
         
         # Add rider name if available from header details
         if hasattr(best_results, 'header_details') and best_results.header_details and best_results.header_details.get('current_team'):
-            rider_name = best_results.soup.find('h1').text.strip() if best_results.soup.find('h1') else f"Rider ID {rider_id}"
-            info += f"Best Results for {rider_name}:\n\n"
+            rider_name = _rider_name_from_html(best_results.response) or f"Rider ID {rider_id}"
+            parts.append(f"Best Results for {rider_name}:\n\n")
         else:
-            info += f"Best Results for Rider ID {rider_id}:\n\n"
+            parts.append(f"Best Results for Rider ID {rider_id}:\n\n")
         
-        # Get top results
-        results_df = best_results.results_df.head(limit)
+        # Get top results, with every column present and missing cells filled once up front
+        results_df = best_results.results_df.head(limit).reindex(
+            columns=['Pos', 'Race', 'Editions', 'CAT', 'Race_Country']
+        ).fillna({'Pos': 'N/A', 'Race': 'N/A', 'Editions': 'N/A', 'CAT': '', 'Race_Country': ''})
         
-        for _, row in results_df.iterrows():
-            pos = row.get('Pos', 'N/A')
-            race = row.get('Race', 'N/A')
-            editions = row.get('Editions', 'N/A')
-            category = row.get('CAT', '')
-            country = row.get('Race_Country', '')
-            
+        for pos, race, editions, category, country in results_df.itertuples(index=False, name=None):
             result_line = f"{pos}. {race}"
             if category:
                 result_line += f" ({category})"
@@ -791,10 +880,10 @@ async def get_rider_best_results(rider_id: int, limit: int = 10) -> str:
                 result_line += f" - {editions}"
             if country:
                 result_line += f" - {country}"
-            info += result_line + "\n"
+            parts.append(result_line + "\n")
         
-        return info
-    except Exception as e:
+        return "".join(parts)
+    except _FETCH_ERRORS as e:
         return f"Error retrieving best results for rider ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
 @mcp.tool(
@@ -838,149 +927,54 @@ async def get_rider_grand_tour_results(rider_id: int) -> str:
         Exception: If the rider is not found or if there are connection issues.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get grand tour results
-        grand_tour_results = rider.grand_tour_results()
+        grand_tour_results = await asyncio.to_thread(_fetch_rider, rider_id, 'grand_tour_results')
         
         # Build information string
-        info = ""
+        buf = io.StringIO()
         
         # Get rider name
-        rider_name = None
-        if hasattr(grand_tour_results, 'header_details') and grand_tour_results.header_details and 'name' in grand_tour_results.header_details:
-            rider_name = grand_tour_results.header_details['name']
-        else:
-            # Try to extract rider name from page title
-            if hasattr(grand_tour_results, 'soup') and grand_tour_results.soup:
-                title = grand_tour_results.soup.find('title')
-                if title and '|' in title.text:
-                    rider_name = title.text.split('|')[0].strip()
+        rider_name = _rider_name(grand_tour_results)
         
         # Format title
         if rider_name:
-            info += f"Grand Tour Results for {rider_name}:\n\n"
+            buf.write(f"Grand Tour Results for {rider_name}:\n\n")
         else:
-            info += f"Grand Tour Results for Rider ID {rider_id}:\n\n"
+            buf.write(f"Grand Tour Results for Rider ID {rider_id}:\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(grand_tour_results, 'results_df') and not (grand_tour_results.results_df is None or grand_tour_results.results_df.empty):
+        if _has_results(grand_tour_results):
             # Use standard parsing
             results_df = grand_tour_results.results_df
-            
-            # Group results by race
-            for race in results_df['Race'].unique():
-                race_results = results_df[results_df['Race'] == race]
-                info += f"{race}:\n"
-                
-                # Sort by year (most recent first)
-                race_results = race_results.sort_values('Year', ascending=False)
-                
-                for _, row in race_results.iterrows():
-                    year = row.get('Year', 'N/A')
-                    pos = row.get('Pos', 'N/A')
-                    time = row.get('Time', '')
-                    
-                    result_line = f"  {year}: {pos}"
-                    if time:
-                        result_line += f" - {time}"
-                    info += result_line + "\n"
-                
-                info += "\n"
         else:
             # Direct HTML parsing
-            if not hasattr(grand_tour_results, 'soup') or not grand_tour_results.soup:
+            if not getattr(grand_tour_results, 'response', None):
                 return f"No Grand Tour results found for rider ID {rider_id}. This rider ID may not exist."
             
-            soup = grand_tour_results.soup
-            
-            # Find Grand Tour results table
-            tables = soup.find_all('table')
-            gt_table = None
+            results_df = parse_grand_tour_html(grand_tour_results.response)
             
-            # Look for the appropriate table that contains Grand Tour results
-            # Usually it's a table with "Tour de France", "Giro d'Italia", or "Vuelta a España" mentioned
-            grand_tours = ["Tour de France", "Giro d'Italia", "Vuelta a España"]
-            
-            for table in tables:
-                for gt in grand_tours:
-                    if gt in table.text:
-                        gt_table = table
-                        break
-                if gt_table:
-                    break
-                
-                # If not found by name, look for a table with "Race" and "Year" columns
-                headers = [th.text.strip() for th in table.find_all('th')]
-                if len(headers) >= 3 and "Race" in headers and "Year" in headers:
-                    gt_table = table
-                    break
-            
-            if not gt_table:
-                return f"Could not find Grand Tour results table for rider ID {rider_id}."
-            
-            # Parse Grand Tour data
-            rows = gt_table.find_all('tr')
-            gt_data = []
-            
-            # Get column indices from header row
-            headers = [th.text.strip() for th in rows[0].find_all('th')]
-            
-            race_idx = next((i for i, h in enumerate(headers) if "Race" in h), None)
-            year_idx = next((i for i, h in enumerate(headers) if "Year" in h), None)
-            pos_idx = next((i for i, h in enumerate(headers) if "Pos" in h), None)
-            time_idx = next((i for i, h in enumerate(headers) if "Time" in h), None)
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                # Extract data
-                race_text = cols[race_idx].text.strip() if race_idx is not None and race_idx < len(cols) else "N/A"
-                year_text = cols[year_idx].text.strip() if year_idx is not None and year_idx < len(cols) else "N/A"
-                pos_text = cols[pos_idx].text.strip() if pos_idx is not None and pos_idx < len(cols) else "N/A"
-                time_text = cols[time_idx].text.strip() if time_idx is not None and time_idx < len(cols) else ""
-                
-                # Only include if it's a Grand Tour
-                if any(gt in race_text for gt in grand_tours):
-                    gt_data.append({
-                        'Race': race_text,
-                        'Year': year_text,
-                        'Pos': pos_text,
-                        'Time': time_text
-                    })
+            if results_df is None:
+                buf.write("No Grand Tour results found for this rider.\n")
+                return buf.getvalue()
+        
+        # Sort once by race and year (most recent first), then group by race
+        results_df = results_df.reindex(columns=['Race', 'Year', 'Pos', 'Time'])
+        results_df = results_df.sort_values(['Race', 'Year'], ascending=[True, False])
+        results_df = results_df.fillna({'Year': 'N/A', 'Pos': 'N/A', 'Time': ''})
+        
+        for race, race_results in results_df.groupby('Race', sort=False):
+            buf.write(f"{race}:\n")
             
-            # Group by race
-            race_grouped = {}
-            for result in gt_data:
-                race = result['Race']
-                if race not in race_grouped:
-                    race_grouped[race] = []
-                race_grouped[race].append(result)
-            
-            # Format output by race
-            for race, results in race_grouped.items():
-                info += f"{race}:\n"
-                
-                # Sort by year (most recent first)
-                results.sort(key=lambda x: x['Year'], reverse=True)
-                
-                for result in results:
-                    result_line = f"  {result['Year']}: {result['Pos']}"
-                    if result['Time']:
-                        result_line += f" - {result['Time']}"
-                    info += result_line + "\n"
-                
-                info += "\n"
+            for year, pos, gap in zip(race_results['Year'].to_numpy(), race_results['Pos'].to_numpy(), race_results['Time'].to_numpy()):
+                result_line = f"  {year}: {pos}"
+                if gap:
+                    result_line += f" - {gap}"
+                buf.write(result_line + "\n")
             
-            if not gt_data:
-                info += "No Grand Tour results found for this rider.\n"
+            buf.write("\n")
         
-        return info
-    except Exception as e:
+        return buf.getvalue()
+    except _FETCH_ERRORS as e:
         return f"Error retrieving Grand Tour results for rider ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
 @mcp.tool(
@@ -1022,63 +1016,47 @@ async def get_rider_monument_results(rider_id: int) -> str:
         Exception: If the rider is not found or if there are connection issues.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get monument results
-        monument_results = rider.monument_results()
+        monument_results = await asyncio.to_thread(_fetch_rider, rider_id, 'monument_results')
         
         # Check if results exist
-        if monument_results is None or not hasattr(monument_results, 'results_df') or monument_results.results_df.empty:
+        if not _has_results(monument_results):
             return f"No Monument results found for rider ID {rider_id}. This rider ID may not exist."
         
         # Build results information string
-        info = ""
+        buf = io.StringIO()
         
         # Add rider name if available from header details
         if hasattr(monument_results, 'header_details') and monument_results.header_details and 'name' in monument_results.header_details:
-            info += f"Monument Results for {monument_results.header_details['name']}:\n\n"
+            buf.write(f"Monument Results for {monument_results.header_details['name']}:\n\n")
         else:
-            info += f"Monument Results for Rider ID {rider_id}:\n\n"
+            buf.write(f"Monument Results for Rider ID {rider_id}:\n\n")
         
         # Get results for each Monument
-        monument_races = {
-            "Milano-Sanremo": [],
-            "Paris-Roubaix": [],
-            "Ronde van Vlaanderen": [],
-            "Liège-Bastogne-Liège": [],
-            "Il Lombardia": []
-        }
+        monument_races = ("Milano-Sanremo", "Paris-Roubaix", "Ronde van Vlaanderen", "Liège-Bastogne-Liège", "Il Lombardia")
         
-        # Group results by monument races
-        for _, row in monument_results.results_df.iterrows():
-            race_name = row.get('Race', '')
-            year = row.get('Year', '')
-            position = row.get('Pos', '')
-            
-            # Check if this is one of the 5 monuments
-            for monument in monument_races:
-                if monument in race_name:
-                    monument_races[monument].append((year, position))
-                    break
+        # Missing columns default to '' as the per-row lookups did
+        results_df = monument_results.results_df.reindex(columns=['Race', 'Year', 'Pos'], fill_value='')
+        race_names = results_df['Race'].astype(str)
         
-        # Format and add results for each monument
-        for monument, results in monument_races.items():
-            if not results:
+        # Select each monument's rows with a vectorized mask
+        for monument in monument_races:
+            monument_df = results_df[race_names.str.contains(monument, regex=False)]
+            if monument_df.empty:
                 continue
                 
-            info += f"{monument}:\n"
+            buf.write(f"{monument}:\n")
             
             # Sort results by year in descending order
-            results.sort(key=lambda x: x[0], reverse=True)
+            monument_df = monument_df.sort_values('Year', ascending=False, kind='stable')
             
-            for year, position in results:
-                info += f"  {year}: {position}\n"
+            for year, position in zip(monument_df['Year'].to_numpy(), monument_df['Pos'].to_numpy()):
+                buf.write(f"  {year}: {position}\n")
             
-            info += "\n"
+            buf.write("\n")
         
-        return info
-    except Exception as e:
+        return buf.getvalue()
+    except _FETCH_ERRORS as e:
         return f"Error retrieving Monument results for rider ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
 @mcp.tool(
@@ -1109,61 +1087,42 @@ async def get_rider_team_and_ranking(rider_id: int) -> str:
         rider_id: The FirstCycling rider ID (e.g., 16973 for Tadej Pogačar)
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get team and ranking information
-        team_ranking = rider.team_and_ranking()
+        team_ranking = await asyncio.to_thread(_fetch_rider, rider_id, 'team_and_ranking')
         
         # Build information string
-        info = ""
+        parts = []
         
-        # Add rider name if available from header details
-        if hasattr(team_ranking, 'header_details') and team_ranking.header_details and 'name' in team_ranking.header_details:
-            rider_name = team_ranking.header_details['name']
-            info += f"Team and Ranking History for {rider_name}:\n\n"
+        # Add rider name if available
+        rider_name = _rider_name(team_ranking)
+        if rider_name:
+            parts.append(f"Team and Ranking History for {rider_name}:\n\n")
         else:
-            # Try to extract rider name from page title
-            if hasattr(team_ranking, 'soup'):
-                title = team_ranking.soup.find('title')
-                if title and '|' in title.text:
-                    rider_name = title.text.split('|')[0].strip()
-                    info += f"Team and Ranking History for {rider_name}:\n\n"
-                else:
-                    info += f"Team and Ranking History for Rider ID {rider_id}:\n\n"
-            else:
-                info += f"Team and Ranking History for Rider ID {rider_id}:\n\n"
+            parts.append(f"Team and Ranking History for Rider ID {rider_id}:\n\n")
         
         # Check if we need to use the default parsing or direct HTML parsing
-        if hasattr(team_ranking, 'results_df') and not (team_ranking.results_df is None or team_ranking.results_df.empty):
+        if _has_results(team_ranking):
             # Use the default parsed results
             results_df = team_ranking.results_df
             
-            # Sort by year (most recent first)
+            # Sort by year (most recent first) and take each year's first entry in one groupby pass
+            results_df = results_df.reindex(columns=['Year', 'Team', 'Ranking', 'Points'])
             results_df = results_df.sort_values('Year', ascending=False)
+            yearly = results_df.groupby('Year', sort=False).first().fillna('N/A')
             
-            # Group by year
-            for year in results_df['Year'].unique():
-                year_data = results_df[results_df['Year'] == year]
-                info += f"{year}:\n"
-                
-                # Get team information
-                team = year_data['Team'].iloc[0] if not year_data['Team'].empty else 'N/A'
-                info += f"  Team: {team}\n"
-                
-                # Get ranking information
-                ranking = year_data['Ranking'].iloc[0] if not year_data['Ranking'].empty else 'N/A'
-                points = year_data['Points'].iloc[0] if not year_data['Points'].empty else 'N/A'
+            for year, team, ranking, points in yearly.itertuples(name=None):
+                parts.append(f"{year}:\n")
+                parts.append(f"  Team: {team}\n")
                 
                 if ranking != 'N/A' or points != 'N/A':
-                    info += "  UCI Ranking: "
+                    parts.append("  UCI Ranking: ")
                     if ranking != 'N/A':
-                        info += f"{ranking}"
+                        parts.append(f"{ranking}")
                     if points != 'N/A':
-                        info += f" ({points} points)"
-                    info += "\n"
+                        parts.append(f" ({points} points)")
+                    parts.append("\n")
                 
-                info += "\n"
+                parts.append("\n")
         else:
             # Direct HTML parsing if results_df is not available
             if not hasattr(team_ranking, 'soup'):
@@ -1178,7 +1137,7 @@ async def get_rider_team_and_ranking(rider_id: int) -> str:
             # Find the table with team and ranking information
             # Usually, it's a table with "Year", "Team", "Ranking", "Points" headers
             for table in tables:
-                headers = [th.text.strip() for th in table.find_all('th')]
+                headers = [th.get_text(' ', strip=True) for th in table.find_all('th')]
                 if len(headers) >= 3 and "Year" in headers and "Team" in headers:
                     stats_table = table
                     break
@@ -1194,17 +1153,17 @@ async def get_rider_team_and_ranking(rider_id: int) -> str:
             for row in rows[1:]:
                 cols = row.find_all('td')
                 if len(cols) >= 3:  # Ensure we have enough columns
-                    year = cols[0].text.strip()
+                    year = cols[0].get_text(' ', strip=True)
                     
                     # Extract team (might be in a link)
                     team_col = cols[1]
                     team_link = team_col.find('a')
-                    team = team_link.text.strip() if team_link else team_col.text.strip()
+                    team = team_link.get_text(' ', strip=True) if team_link else team_col.get_text(' ', strip=True)
                     
                     # Extract ranking and points 
                     # (format can vary but typically in columns 2 and 3)
-                    ranking = cols[2].text.strip() if len(cols) > 2 else 'N/A'
-                    points = cols[3].text.strip() if len(cols) > 3 else 'N/A'
+                    ranking = cols[2].get_text(' ', strip=True) if len(cols) > 2 else 'N/A'
+                    points = cols[3].get_text(' ', strip=True) if len(cols) > 3 else 'N/A'
                     
                     data.append({
                         'Year': year,
@@ -1218,24 +1177,24 @@ async def get_rider_team_and_ranking(rider_id: int) -> str:
             
             # Build the information string
             for item in data:
-                info += f"{item['Year']}:\n"
-                info += f"  Team: {item['Team']}\n"
+                parts.append(f"{item['Year']}:\n")
+                parts.append(f"  Team: {item['Team']}\n")
                 
                 if item['Ranking'] != 'N/A' or item['Points'] != 'N/A':
-                    info += "  UCI Ranking: "
+                    parts.append("  UCI Ranking: ")
                     if item['Ranking'] != 'N/A':
-                        info += f"{item['Ranking']}"
+                        parts.append(f"{item['Ranking']}")
                     if item['Points'] != 'N/A':
-                        info += f" ({item['Points']} points)"
-                    info += "\n"
+                        parts.append(f" ({item['Points']} points)")
+                    parts.append("\n")
                 
-                info += "\n"
+                parts.append("\n")
             
             if not data:
                 return f"No team and ranking information could be parsed for rider ID {rider_id}."
         
-        return info
-    except Exception as e:
+        return "".join(parts)
+    except _FETCH_ERRORS as e:
         return f"An error occurred while getting team and ranking information for rider ID {rider_id}: {str(e)}"
 
 @mcp.tool(
@@ -1267,215 +1226,87 @@ async def get_rider_race_history(rider_id: int, year: int = None) -> str:
         year: Optional year to filter results (e.g., 2023). If not provided, returns all years.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get race history
-        race_history = rider.race_history()
+        race_history = await asyncio.to_thread(_fetch_rider, rider_id, 'race_history')
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
-        rider_name = None
-        if hasattr(race_history, 'header_details') and race_history.header_details and 'name' in race_history.header_details:
-            rider_name = race_history.header_details['name']
-        else:
-            # Try to extract rider name from page title
-            if hasattr(race_history, 'soup') and race_history.soup:
-                title = race_history.soup.find('title')
-                if title and '|' in title.text:
-                    rider_name = title.text.split('|')[0].strip()
+        rider_name = _rider_name(race_history)
         
         # Format title
         if rider_name:
-            info += f"Race History for {rider_name}"
+            parts.append(f"Race History for {rider_name}")
         else:
-            info += f"Race History for Rider ID {rider_id}"
+            parts.append(f"Race History for Rider ID {rider_id}")
         
         if year:
-            info += f" ({year})"
-        info += ":\n\n"
+            parts.append(f" ({year})")
+        parts.append(":\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(race_history, 'results_df') and not (race_history.results_df is None or race_history.results_df.empty):
+        if _has_results(race_history):
             # Use standard parsing
             results_df = race_history.results_df
-            
-            # Filter by year if specified
-            if year:
-                results_df = results_df[results_df['Year'] == year]
-            
-            # Sort by date (most recent first)
-            results_df = results_df.sort_values('Date', ascending=False)
-            
-            # Group by year
-            for year_val in results_df['Year'].unique():
-                year_data = results_df[results_df['Year'] == year_val]
-                info += f"{year_val}:\n"
-                
-                for _, row in year_data.iterrows():
-                    date = row.get('Date', 'N/A')
-                    race = row.get('Race', 'N/A')
-                    pos = row.get('Pos', 'N/A')
-                    category = row.get('CAT', 'N/A')
-                    time = row.get('Time', '')
-                    
-                    result_line = f"  {date} - {race} ({category}): {pos}"
-                    if time:
-                        result_line += f" - {time}"
-                    info += result_line + "\n"
-                
-                info += "\n"
         else:
             # Direct HTML parsing
-            if not hasattr(race_history, 'soup') or not race_history.soup:
+            if not getattr(race_history, 'response', None):
                 return f"No race history found for rider ID {rider_id}. This rider ID may not exist."
             
-            soup = race_history.soup
+            # Let pandas read the race table straight from the page
+            results_df = parse_race_history_html(race_history.response)
             
-            # Find race history table
-            tables = soup.find_all('table')
-            race_table = None
-            
-            # First try to find tables with specific headers
-            for table in tables:
-                headers = [th.text.strip() for th in table.find_all('th')]
-                if len(headers) >= 3 and any(("Date" in h or "Race" in h or "Pos" in h) for h in headers):
-                    race_table = table
-                    break
-            
-            # If not found, look for any table that might contain race data
-            if not race_table and tables:
-                # Try to find a table with typical race data structure (multiple rows with dates, etc.)
-                for table in tables:
-                    rows = table.find_all('tr')
-                    if len(rows) >= 3:  # Header row + at least 2 data rows
-                        # Check if any cell in the first row contains date-like text
-                        first_row_cells = rows[1].find_all('td')
-                        for cell in first_row_cells:
-                            cell_text = cell.text.strip()
-                            # Look for date patterns like DD.MM or YYYY or MM/DD
-                            if (len(cell_text) >= 4 and 
-                                ('.' in cell_text or '/' in cell_text or '-' in cell_text or 
-                                 (cell_text.isdigit() and int(cell_text) > 2000 and int(cell_text) < 2030))):
-                                race_table = table
-                                break
-                    if race_table:
-                        break
-            
-            # If we still couldn't find a table, direct URL request to races page
-            if not race_table:
-                # Try to directly access the races page
+            # If we couldn't find a table, direct URL request to races page
+            if results_df is None:
                 races_url = f"https://firstcycling.com/rider.php?r={rider_id}&races=2"
                 try:
-                    races_response = requests.get(races_url)
+                    races_response = await asyncio.to_thread(_SESSION.get, races_url, timeout=_REQUEST_TIMEOUT)
                     if races_response.status_code == 200:
-                        races_soup = BeautifulSoup(races_response.text, 'html.parser')
-                        tables = races_soup.find_all('table')
-                        
-                        # Look for tables with race data
-                        for table in tables:
-                            headers = [th.text.strip() for th in table.find_all('th')]
-                            if len(headers) >= 3 and any(keyword in ' '.join(headers).lower() 
-                                                        for keyword in ['date', 'race', 'result', 'position']):
-                                race_table = table
-                                break
-                except Exception as table_error:
-                    # If direct access fails, continue with the original soup
+                        results_df = parse_race_history_html(races_response.content)
+                except requests.RequestException:
+                    # If direct access fails, report the missing table below
                     pass
             
-            if not race_table:
-                # Get the rider name for a more helpful error message
-                rider_name_text = ""
-                try:
-                    if hasattr(race_history, 'soup'):
-                        name_element = race_history.soup.find('h1')
-                        if name_element:
-                            rider_name_text = f" ({name_element.text.strip()})"
-                except:
-                    pass
-                
+            if results_df is None:
+                # Include the rider name for a more helpful error message
+                rider_name_text = f" ({rider_name})" if rider_name else ""
                 return f"Could not find race history table for rider ID {rider_id}{rider_name_text}. The data may not be available on FirstCycling."
-            
-            # Parse race data
-            rows = race_table.find_all('tr')
-            race_data = []
-            
-            # Get column indices from header row
-            headers = [th.text.strip() for th in rows[0].find_all('th')] if rows and rows[0].find_all('th') else []
-            
-            # Determine column positions, with fallbacks if headers aren't clear
-            date_idx = next((i for i, h in enumerate(headers) if "Date" in h), 0)  # Default to first column
-            race_idx = next((i for i, h in enumerate(headers) if "Race" in h), 1)  # Default to second column
-            pos_idx = next((i for i, h in enumerate(headers) if "Pos" in h or "Result" in h), 2)  # Default to third column
-            cat_idx = next((i for i, h in enumerate(headers) if "CAT" in h or "Category" in h), None)  # May not exist
-            
-            # Skip header row if it exists
-            start_row = 1 if headers else 0
-            
-            for row in rows[start_row:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                # Extract data
-                date_text = cols[date_idx].text.strip() if date_idx is not None and date_idx < len(cols) else "N/A"
-                race_text = cols[race_idx].text.strip() if race_idx is not None and race_idx < len(cols) else "N/A"
-                pos_text = cols[pos_idx].text.strip() if pos_idx is not None and pos_idx < len(cols) else "N/A"
-                cat_text = cols[cat_idx].text.strip() if cat_idx is not None and cat_idx < len(cols) else "N/A"
-                
-                # Extract year from date (format may vary, but often includes year)
-                race_year = None
-                if date_text != "N/A":
-                    # Try common date formats to extract year
-                    if len(date_text) >= 4:
-                        try:
-                            # If year is last part (e.g., "01.01.2023")
-                            race_year = int(date_text[-4:])
-                        except Exception:
-                            # If year is first part (e.g., "2023-01-01")
-                            try:
-                                race_year = int(date_text[:4])
-                            except Exception:
-                                pass
-                
-                if race_year:
-                    # Skip if a specific year was requested and this race is from a different year
-                    if year and race_year != year:
-                        continue
-                    
-                    race_data.append({
-                        'Year': race_year,
-                        'Date': date_text,
-                        'Race': race_text,
-                        'Pos': pos_text,
-                        'CAT': cat_text
-                    })
-            
-            # Group by year
-            year_grouped = {}
-            for race in race_data:
-                year_val = race['Year']
-                if year_val not in year_grouped:
-                    year_grouped[year_val] = []
-                year_grouped[year_val].append(race)
-            
-            # Sort years (most recent first)
-            for year_val in sorted(year_grouped.keys(), reverse=True):
-                races = year_grouped[year_val]
-                info += f"{year_val}:\n"
-                
-                for race in races:
-                    result_line = f"  {race['Date']} - {race['Race']} ({race['CAT']}): {race['Pos']}"
-                    info += result_line + "\n"
-                
-                info += "\n"
-            
-            if not race_data:
-                info += "No race history found for this rider.\n"
         
-        return info
+        # Filter by year if specified
+        if year:
+            results_df = results_df[results_df['Year'] == year]
+        
+        # One sort by year then date (most recent first) leaves each year's races
+        # together and in date order, so a single pass writes them out; dates like
+        # "22.04" are compared month first
+        results_df = results_df.sort_values(['Year', 'Date'], ascending=[False, False], key=_date_sort_key)
+        
+        current_year = None
+        for row in results_df.itertuples(index=False):
+            if row.Year != current_year:
+                if current_year is not None:
+                    parts.append("\n")
+                current_year = row.Year
+                parts.append(f"{current_year}:\n")
+            
+            date = getattr(row, 'Date', 'N/A')
+            race = getattr(row, 'Race', 'N/A')
+            pos = getattr(row, 'Pos', 'N/A')
+            category = getattr(row, 'CAT', 'N/A')
+            gap = getattr(row, 'Time', '')
+            
+            result_line = f"  {date} - {race} ({category}): {pos}"
+            if gap:
+                result_line += f" - {gap}"
+            parts.append(result_line + "\n")
+        
+        if current_year is None:
+            parts.append("No race history found for this rider.\n")
+        else:
+            parts.append("\n")
+        
+        return "".join(parts)
     except Exception as e:
         return f"Error searching for riders: {str(e)}"
 
@@ -1508,22 +1339,22 @@ async def search_race(query: str) -> str:
     """
     try:
         # Search for races
-        races = Race.search(query)
+        races = await asyncio.to_thread(Race.search, query)
         
         if not races:
             return f"No races found matching the query '{query}'."
         
         # Build results string
-        info = f"Found {len(races)} races matching '{query}':\n\n"
+        parts = [f"Found {len(races)} races matching '{query}':\n\n"]
         
         for race in races:
-            info += f"ID: {race['id']}\n"
-            info += f"Name: {race['name']}\n"
+            parts.append(f"ID: {race['id']}\n")
+            parts.append(f"Name: {race['name']}\n")
             if race['country']:
-                info += f"Country: {race['country'].upper()}\n"
-            info += "\n"
+                parts.append(f"Country: {race['country'].upper()}\n")
+            parts.append("\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error searching for races: {str(e)}"
 
@@ -1558,171 +1389,70 @@ async def get_rider_one_day_races(rider_id: int, year: int = None) -> str:
         year: Optional year to filter results (e.g., 2023). If not provided, returns all years.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get one-day races results
-        one_day_results = rider.one_day_races()
+        one_day_results = await asyncio.to_thread(_fetch_rider, rider_id, 'one_day_races')
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
-        rider_name = None
-        if hasattr(one_day_results, 'header_details') and one_day_results.header_details and 'name' in one_day_results.header_details:
-            rider_name = one_day_results.header_details['name']
-        else:
-            # Try to extract rider name from page title
-            if hasattr(one_day_results, 'soup') and one_day_results.soup:
-                title = one_day_results.soup.find('title')
-                if title and '|' in title.text:
-                    rider_name = title.text.split('|')[0].strip()
+        rider_name = _rider_name(one_day_results)
         
         # Format title
         if rider_name:
-            info += f"One-Day Race Results for {rider_name}"
+            parts.append(f"One-Day Race Results for {rider_name}")
         else:
-            info += f"One-Day Race Results for Rider ID {rider_id}"
+            parts.append(f"One-Day Race Results for Rider ID {rider_id}")
         
         if year:
-            info += f" ({year})"
-        info += ":\n\n"
+            parts.append(f" ({year})")
+        parts.append(":\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(one_day_results, 'results_df') and not (one_day_results.results_df is None or one_day_results.results_df.empty):
+        if _has_results(one_day_results):
             # Use standard parsing
             results_df = one_day_results.results_df
-            
-            # Filter by year if specified
-            if year:
-                results_df = results_df[results_df['Year'] == year]
-            
-            # Sort by year (most recent first)
-            results_df = results_df.sort_values('Year', ascending=False)
-            
-            # Group by year
-            for year_val in results_df['Year'].unique():
-                year_data = results_df[results_df['Year'] == year_val]
-                info += f"{year_val}:\n"
-                
-                # Sort by date within year
-                year_data = year_data.sort_values('Date', ascending=False)
-                
-                for _, row in year_data.iterrows():
-                    date = row.get('Date', 'N/A')
-                    race = row.get('Race', 'N/A')
-                    pos = row.get('Pos', 'N/A')
-                    category = row.get('CAT', 'N/A')
-                    
-                    info += f"  {date} - {race} ({category}): {pos}\n"
-                
-                info += "\n"
         else:
             # Direct HTML parsing
-            if not hasattr(one_day_results, 'soup') or not one_day_results.soup:
+            html = getattr(one_day_results, 'response', None)
+            if not html:
                 return f"No one-day race results found for rider ID {rider_id}. This rider ID may not exist."
             
-            soup = one_day_results.soup
-            
-            # Find one-day races results table
-            tables = soup.find_all('table')
-            results_table = None
-            
-            # Look for the appropriate table that contains one-day races results
-            for table in tables:
-                # Check table headers to find the right one
-                headers = [th.text.strip() for th in table.find_all('th')]
-                if len(headers) >= 3 and "Race" in headers and ("Date" in headers or "Year" in headers):
-                    results_table = table
-                    break
-            
-            if not results_table:
+            # Let pandas read the results table straight from the page
+            results_df = parse_race_results_html(html)
+            if results_df is None:
                 return f"Could not find one-day race results table for rider ID {rider_id}."
-            
-            # Parse one-day races data
-            rows = results_table.find_all('tr')
-            race_data = []
-            
-            # Get column indices from header row
-            headers = [th.text.strip() for th in rows[0].find_all('th')]
-            
-            # Find the indices of key columns
-            year_idx = next((i for i, h in enumerate(headers) if "Year" in h), None)
-            date_idx = next((i for i, h in enumerate(headers) if "Date" in h), None)
-            race_idx = next((i for i, h in enumerate(headers) if "Race" in h), None)
-            pos_idx = next((i for i, h in enumerate(headers) if "Pos" in h), None)
-            cat_idx = next((i for i, h in enumerate(headers) if "CAT" in h), None)
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                # Extract data
-                race_year = cols[year_idx].text.strip() if year_idx is not None and year_idx < len(cols) else None
-                
-                # If we don't have a year column, try to extract from date
-                if race_year is None and date_idx is not None and date_idx < len(cols):
-                    date_text = cols[date_idx].text.strip()
-                    # Try to extract year from date format (e.g., 01.01.2023 or 2023-01-01)
-                    try:
-                        if len(date_text) >= 4:
-                            if date_text[-4:].isdigit():
-                                race_year = date_text[-4:]
-                            elif date_text[:4].isdigit():
-                                race_year = date_text[:4]
-                    except Exception:
-                        pass
-                
-                # If we still don't have a year, use the next row
-                if race_year is None or not race_year.isdigit():
-                    continue
-                
-                # Convert year to int for comparison
-                race_year_int = int(race_year)
-                
-                # Skip if a specific year was requested and this race is from a different year
-                if year and race_year_int != year:
-                    continue
-                
-                date_text = cols[date_idx].text.strip() if date_idx is not None and date_idx < len(cols) else "N/A"
-                race_text = cols[race_idx].text.strip() if race_idx is not None and race_idx < len(cols) else "N/A"
-                pos_text = cols[pos_idx].text.strip() if pos_idx is not None and pos_idx < len(cols) else "N/A"
-                cat_text = cols[cat_idx].text.strip() if cat_idx is not None and cat_idx < len(cols) else "N/A"
-                
-                race_data.append({
-                    'Year': race_year_int,
-                    'Date': date_text,
-                    'Race': race_text,
-                    'Pos': pos_text,
-                    'CAT': cat_text
-                })
-            
-            # Group by year
-            year_grouped = {}
-            for race in race_data:
-                year_val = race['Year']
-                if year_val not in year_grouped:
-                    year_grouped[year_val] = []
-                year_grouped[year_val].append(race)
-            
-            # Sort years (most recent first)
-            for year_val in sorted(year_grouped.keys(), reverse=True):
-                races = year_grouped[year_val]
-                info += f"{year_val}:\n"
-                
-                # Sort by date within year (can be complex due to different date formats)
-                # For now, just display as is
-                for race in races:
-                    info += f"  {race['Date']} - {race['Race']} ({race['CAT']}): {race['Pos']}\n"
-                
-                info += "\n"
-            
-            if not race_data:
-                info += "No one-day race results found for this rider.\n"
         
-        return info
+        # Filter by year if specified
+        if year:
+            results_df = results_df[results_df['Year'] == year]
+        
+        # One sort by year then date (most recent first) leaves each year's races
+        # together and in date order, so a single pass writes them out; dates like
+        # "22.04" are compared month first
+        results_df = results_df.sort_values(['Year', 'Date'], ascending=[False, False], key=_date_sort_key)
+        
+        current_year = None
+        for row in results_df.itertuples(index=False):
+            if row.Year != current_year:
+                if current_year is not None:
+                    parts.append("\n")
+                current_year = row.Year
+                parts.append(f"{current_year}:\n")
+            
+            date = getattr(row, 'Date', 'N/A')
+            race = getattr(row, 'Race', 'N/A')
+            pos = getattr(row, 'Pos', 'N/A')
+            category = getattr(row, 'CAT', 'N/A')
+            
+            parts.append(f"  {date} - {race} ({category}): {pos}\n")
+        
+        if current_year is None:
+            parts.append("No one-day race results found for this rider.\n")
+        else:
+            parts.append("\n")
+        
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving one-day race results for rider ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
@@ -1757,171 +1487,70 @@ async def get_rider_stage_races(rider_id: int, year: int = None) -> str:
         year: Optional year to filter results (e.g., 2023). If not provided, returns all years.
     """
     try:
-        # Create a rider instance
-        rider = Rider(rider_id)
-        
         # Get stage races results
-        stage_results = rider.stage_races()
+        stage_results = await asyncio.to_thread(_fetch_rider, rider_id, 'stage_races')
         
         # Build information string
-        info = ""
+        parts = []
         
         # Get rider name
-        rider_name = None
-        if hasattr(stage_results, 'header_details') and stage_results.header_details and 'name' in stage_results.header_details:
-            rider_name = stage_results.header_details['name']
-        else:
-            # Try to extract rider name from page title
-            if hasattr(stage_results, 'soup') and stage_results.soup:
-                title = stage_results.soup.find('title')
-                if title and '|' in title.text:
-                    rider_name = title.text.split('|')[0].strip()
+        rider_name = _rider_name(stage_results)
         
         # Format title
         if rider_name:
-            info += f"Stage Race Results for {rider_name}"
+            parts.append(f"Stage Race Results for {rider_name}")
         else:
-            info += f"Stage Race Results for Rider ID {rider_id}"
+            parts.append(f"Stage Race Results for Rider ID {rider_id}")
         
         if year:
-            info += f" ({year})"
-        info += ":\n\n"
+            parts.append(f" ({year})")
+        parts.append(":\n\n")
         
         # Check if we need to use standard parsing or direct HTML parsing
-        if hasattr(stage_results, 'results_df') and not (stage_results.results_df is None or stage_results.results_df.empty):
+        if _has_results(stage_results):
             # Use standard parsing
             results_df = stage_results.results_df
-            
-            # Filter by year if specified
-            if year:
-                results_df = results_df[results_df['Year'] == year]
-            
-            # Sort by year (most recent first)
-            results_df = results_df.sort_values('Year', ascending=False)
-            
-            # Group by year
-            for year_val in results_df['Year'].unique():
-                year_data = results_df[results_df['Year'] == year_val]
-                info += f"{year_val}:\n"
-                
-                # Sort by date within year
-                year_data = year_data.sort_values('Date', ascending=False)
-                
-                for _, row in year_data.iterrows():
-                    date = row.get('Date', 'N/A')
-                    race = row.get('Race', 'N/A')
-                    pos = row.get('Pos', 'N/A')
-                    category = row.get('CAT', 'N/A')
-                    
-                    info += f"  {date} - {race} ({category}): {pos}\n"
-                
-                info += "\n"
         else:
             # Direct HTML parsing
-            if not hasattr(stage_results, 'soup') or not stage_results.soup:
+            html = getattr(stage_results, 'response', None)
+            if not html:
                 return f"No stage race results found for rider ID {rider_id}. This rider ID may not exist."
             
-            soup = stage_results.soup
-            
-            # Find stage races results table
-            tables = soup.find_all('table')
-            results_table = None
-            
-            # Look for the appropriate table that contains stage races results
-            for table in tables:
-                # Check table headers to find the right one
-                headers = [th.text.strip() for th in table.find_all('th')]
-                if len(headers) >= 3 and "Race" in headers and ("Date" in headers or "Year" in headers):
-                    results_table = table
-                    break
-            
-            if not results_table:
+            # Let pandas read the results table straight from the page
+            results_df = parse_race_results_html(html)
+            if results_df is None:
                 return f"Could not find stage race results table for rider ID {rider_id}."
-            
-            # Parse stage races data
-            rows = results_table.find_all('tr')
-            race_data = []
-            
-            # Get column indices from header row
-            headers = [th.text.strip() for th in rows[0].find_all('th')]
-            
-            # Find the indices of key columns
-            year_idx = next((i for i, h in enumerate(headers) if "Year" in h), None)
-            date_idx = next((i for i, h in enumerate(headers) if "Date" in h), None)
-            race_idx = next((i for i, h in enumerate(headers) if "Race" in h), None)
-            pos_idx = next((i for i, h in enumerate(headers) if "Pos" in h), None)
-            cat_idx = next((i for i, h in enumerate(headers) if "CAT" in h), None)
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                # Extract data
-                race_year = cols[year_idx].text.strip() if year_idx is not None and year_idx < len(cols) else None
-                
-                # If we don't have a year column, try to extract from date
-                if race_year is None and date_idx is not None and date_idx < len(cols):
-                    date_text = cols[date_idx].text.strip()
-                    # Try to extract year from date format (e.g., 01.01.2023 or 2023-01-01)
-                    try:
-                        if len(date_text) >= 4:
-                            if date_text[-4:].isdigit():
-                                race_year = date_text[-4:]
-                            elif date_text[:4].isdigit():
-                                race_year = date_text[:4]
-                    except Exception:
-                        pass
-                
-                # If we still don't have a year, use the next row
-                if race_year is None or not race_year.isdigit():
-                    continue
-                
-                # Convert year to int for comparison
-                race_year_int = int(race_year)
-                
-                # Skip if a specific year was requested and this race is from a different year
-                if year and race_year_int != year:
-                    continue
-                
-                date_text = cols[date_idx].text.strip() if date_idx is not None and date_idx < len(cols) else "N/A"
-                race_text = cols[race_idx].text.strip() if race_idx is not None and race_idx < len(cols) else "N/A"
-                pos_text = cols[pos_idx].text.strip() if pos_idx is not None and pos_idx < len(cols) else "N/A"
-                cat_text = cols[cat_idx].text.strip() if cat_idx is not None and cat_idx < len(cols) else "N/A"
-                
-                race_data.append({
-                    'Year': race_year_int,
-                    'Date': date_text,
-                    'Race': race_text,
-                    'Pos': pos_text,
-                    'CAT': cat_text
-                })
-            
-            # Group by year
-            year_grouped = {}
-            for race in race_data:
-                year_val = race['Year']
-                if year_val not in year_grouped:
-                    year_grouped[year_val] = []
-                year_grouped[year_val].append(race)
-            
-            # Sort years (most recent first)
-            for year_val in sorted(year_grouped.keys(), reverse=True):
-                races = year_grouped[year_val]
-                info += f"{year_val}:\n"
-                
-                # Sort by date within year (can be complex due to different date formats)
-                # For now, just display as is
-                for race in races:
-                    info += f"  {race['Date']} - {race['Race']} ({race['CAT']}): {race['Pos']}\n"
-                
-                info += "\n"
-            
-            if not race_data:
-                info += "No stage race results found for this rider.\n"
         
-        return info
+        # Filter by year if specified
+        if year:
+            results_df = results_df[results_df['Year'] == year]
+        
+        # One sort by year then date (most recent first) leaves each year's races
+        # together and in date order, so a single pass writes them out; dates like
+        # "22.04" are compared month first
+        results_df = results_df.sort_values(['Year', 'Date'], ascending=[False, False], key=_date_sort_key)
+        
+        current_year = None
+        for row in results_df.itertuples(index=False):
+            if row.Year != current_year:
+                if current_year is not None:
+                    parts.append("\n")
+                current_year = row.Year
+                parts.append(f"{current_year}:\n")
+            
+            date = getattr(row, 'Date', 'N/A')
+            race = getattr(row, 'Race', 'N/A')
+            pos = getattr(row, 'Pos', 'N/A')
+            category = getattr(row, 'CAT', 'N/A')
+            
+            parts.append(f"  {date} - {race} ({category}): {pos}\n")
+        
+        if current_year is None:
+            parts.append("No stage race results found for this rider.\n")
+        else:
+            parts.append("\n")
+        
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving stage race results for rider ID {rider_id}: {str(e)}. The rider ID may not exist or there might be a connection issue."
 
@@ -1955,10 +1584,10 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
         race = Race(race_id)
         
         # Get race overview
-        race_overview = race.overview(classification_num)
+        race_overview = await asyncio.to_thread(race.overview, classification_num)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Check if we can parse the data
         if not hasattr(race_overview, 'soup') or not race_overview.soup:
@@ -1970,7 +1599,7 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
         title = soup.find('title')
         race_name = title.text.split('|')[0].strip() if title and '|' in title.text else f"Race ID {race_id}"
         
-        info += f"Race Details for {race_name}:\n\n"
+        parts.append(f"Race Details for {race_name}:\n\n")
         
         # Extract basic information
         basic_info = {}
@@ -1996,18 +1625,18 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
         
         # Format basic information
         if basic_info:
-            info += "Basic Information:\n"
+            parts.append("Basic Information:\n")
             for key, value in basic_info.items():
-                info += f"  {key}: {value}\n"
-            info += "\n"
+                parts.append(f"  {key}: {value}\n")
+            parts.append("\n")
         
         # Look for course/race description
         description_div = soup.find('div', class_='w3-padding')
         if description_div:
             description_text = description_div.text.strip()
             if description_text:
-                info += "Description:\n"
-                info += f"  {description_text}\n\n"
+                parts.append("Description:\n")
+                parts.append(f"  {description_text}\n\n")
         
         # Look for winners/podium information
         winners_table = None
@@ -2019,7 +1648,7 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
                 break
         
         if winners_table:
-            info += "Recent Winners:\n"
+            parts.append("Recent Winners:\n")
             
             rows = winners_table.find_all('tr')
             # Skip header row
@@ -2032,9 +1661,9 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
                     year = cols[0].text.strip()
                     winner = cols[1].text.strip()
                     
-                    info += f"  {year}: {winner}\n"
+                    parts.append(f"  {year}: {winner}\n")
             
-            info += "\n"
+            parts.append("\n")
         
         # If standard parsing doesn't work, try direct HTML parsing
         if not basic_info and not description_div and not winners_table:
@@ -2043,26 +1672,26 @@ async def get_race_details(race_id: int, classification_num: int = None) -> str:
             for p in paragraphs:
                 p_text = p.text.strip()
                 if len(p_text) > 50:  # Only include substantial paragraphs
-                    info += f"{p_text}\n\n"
+                    parts.append(f"{p_text}\n\n")
                     
             # Extract any header information
             headers = soup.find_all(['h1', 'h2', 'h3'])
             for header in headers:
                 header_text = header.text.strip()
                 if race_name not in header_text:  # Avoid duplicating the race name
-                    info += f"{header_text}\n"
+                    parts.append(f"{header_text}\n")
                     
                     # Get the next element if it's a paragraph
                     next_element = header.find_next_sibling()
                     if next_element and next_element.name == 'p':
                         p_text = next_element.text.strip()
                         if p_text:
-                            info += f"  {p_text}\n\n"
+                            parts.append(f"  {p_text}\n\n")
         
-        if info == f"Race Details for {race_name}:\n\n":
+        if len(parts) == 1:  # Only the title was added
             return f"Could not find specific details for race ID {race_id}."
             
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving race details for race ID {race_id}: {str(e)}"
 
@@ -2102,10 +1731,10 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
         race_edition = race.edition(year)
         
         # Get results
-        results = race_edition.results(classification_num, stage_num)
+        results = await asyncio.to_thread(race_edition.results, classification_num, stage_num)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Check if we can parse the data
         if not hasattr(results, 'soup') or not results.soup:
@@ -2118,9 +1747,9 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
         race_name = title.text.split('|')[0].strip() if title and '|' in title.text else f"Race ID {race_id}"
         
         # Format title based on parameters
-        info += f"{year} {race_name}"
+        parts.append(f"{year} {race_name}")
         if stage_num is not None:
-            info += f" - Stage {stage_num}"
+            parts.append(f" - Stage {stage_num}")
         elif classification_num is not None:
             classification_names = {
                 1: "General Classification",
@@ -2130,11 +1759,11 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
                 5: "Team Classification"
             }
             if classification_num in classification_names:
-                info += f" - {classification_names[classification_num]}"
-        info += " Results:\n\n"
+                parts.append(f" - {classification_names[classification_num]}")
+        parts.append(" Results:\n\n")
         
         # Check if we have results DataFrame
-        if hasattr(results, 'results_df') and not (results.results_df is None or results.results_df.empty):
+        if _has_results(results):
             # Use standard parsing
             results_df = results.results_df
             
@@ -2145,16 +1774,16 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
                 pos = row.get('Pos', 'N/A')
                 rider = row.get('Rider', 'N/A')
                 team = row.get('Team', 'N/A')
-                time = row.get('Time', 'N/A')
+                gap = row.get('Time', 'N/A')
                 
                 result_line = f"{pos}. {rider} ({team})"
-                if time and time != 'N/A':
-                    result_line += f" - {time}"
+                if gap and gap != 'N/A':
+                    result_line += f" - {gap}"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
             
             if len(results_df) == 20:
-                info += "...\n"
+                parts.append("...\n")
         else:
             # Direct HTML parsing
             # Find results table
@@ -2170,8 +1799,8 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
             if not results_table:
                 return f"Could not find results table for race ID {race_id}, year {year}."
             
-            # Parse results
-            rows = results_table.find_all('tr')
+            # Parse results (header + 20 results + one more row to detect truncation)
+            rows = results_table.find_all('tr', limit=22)
             
             # Get column indices
             headers = [th.text.strip() for th in rows[0].find_all('th')]
@@ -2184,32 +1813,25 @@ async def get_race_edition_results(race_id: int, year: int, classification_num:
             max_rows = min(21, len(rows))
             
             for row in rows[1:max_rows]:
-                cols = row.find_all('td')
+                cols = _row_texts(row)
                 if len(cols) < 3:  # Ensure it's a data row
                     continue
                 
-                pos = cols[pos_idx].text.strip() if pos_idx < len(cols) else "N/A"
-                
-                # Rider name can be in a link
-                rider_col = cols[rider_idx] if rider_idx < len(cols) else None
-                rider = rider_col.text.strip() if rider_col else "N/A"
-                
-                # Team can be in a link
-                team_col = cols[team_idx] if team_idx < len(cols) else None
-                team = team_col.text.strip() if team_col else "N/A"
-                
-                time = cols[time_idx].text.strip() if time_idx < len(cols) and time_idx < len(cols) else "N/A"
+                pos = cols[pos_idx] if pos_idx < len(cols) else "N/A"
+                rider = cols[rider_idx] if rider_idx < len(cols) else "N/A"
+                team = cols[team_idx] if team_idx < len(cols) else "N/A"
+                gap = cols[time_idx] if time_idx < len(cols) else "N/A"
                 
                 result_line = f"{pos}. {rider} ({team})"
-                if time and time != 'N/A':
-                    result_line += f" - {time}"
+                if gap and gap != 'N/A':
+                    result_line += f" - {gap}"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
                 
             if len(rows) > 21:
-                info += "...\n"
+                parts.append("...\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving race results for race ID {race_id}, year {year}: {str(e)}"
 
@@ -2248,10 +1870,10 @@ async def get_start_list(race_id: int, year: int = None) -> str:
         race_edition = race.edition(year)
         
         # Get start list
-        start_list = race_edition.startlist()
+        start_list = await asyncio.to_thread(race_edition.startlist)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Check if we can parse the data
         if not hasattr(start_list, 'soup') or not start_list.soup:
@@ -2264,7 +1886,7 @@ async def get_start_list(race_id: int, year: int = None) -> str:
         race_name = title.text.split('|')[0].strip() if title and '|' in title.text else f"Race ID {race_id}"
         
         # Add header
-        info += f"{year} {race_name} - Start List:\n\n"
+        parts.append(f"{year} {race_name} - Start List:\n\n")
         
         # Find all team tables
         team_tables = soup.find_all('table', {'class': 'tablesorter'})
@@ -2284,7 +1906,7 @@ async def get_start_list(race_id: int, year: int = None) -> str:
                 continue
                 
             team_name = team_link.text.strip()
-            info += f"\n{team_name}:\n"
+            parts.append(f"\n{team_name}:\n")
             
             # Process riders
             for row in table.find('tbody').find_all('tr'):
@@ -2322,9 +1944,9 @@ async def get_start_list(race_id: int, year: int = None) -> str:
                     rider_line += f" ({nationality})"
                 if is_not_starting:
                     rider_line += " [NOT STARTING]"
-                info += rider_line + "\n"
+                parts.append(rider_line + "\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving start list for race ID {race_id}, year {year}: {str(e)}"
 
@@ -2357,10 +1979,10 @@ async def get_race_victory_table(race_id: int) -> str:
         race = Race(race_id)
         
         # Get victory table
-        victory_table = race.victory_table()
+        victory_table = await asyncio.to_thread(race.victory_table)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Check if we can parse the data
         if not hasattr(victory_table, 'soup') or not victory_table.soup:
@@ -2372,10 +1994,10 @@ async def get_race_victory_table(race_id: int) -> str:
         title = soup.find('title')
         race_name = title.text.split('|')[0].strip() if title and '|' in title.text else f"Race ID {race_id}"
         
-        info += f"Victory Table for {race_name}:\n\n"
+        parts.append(f"Victory Table for {race_name}:\n\n")
         
         # Check if we have results DataFrame
-        if hasattr(victory_table, 'results_df') and not (victory_table.results_df is None or victory_table.results_df.empty):
+        if _has_results(victory_table):
             # Use standard parsing
             results_df = victory_table.results_df
             
@@ -2395,7 +2017,7 @@ async def get_race_victory_table(race_id: int) -> str:
                 if years:
                     result_line += f" ({years})"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
         else:
             # Direct HTML parsing
             # Find victory table
@@ -2411,8 +2033,8 @@ async def get_race_victory_table(race_id: int) -> str:
             if not victory_table_el:
                 return f"Could not find victory table for race ID {race_id}."
             
-            # Parse victory data
-            rows = victory_table_el.find_all('tr')
+            # Parse victory data (header + 20 entries + one more row to detect truncation)
+            rows = victory_table_el.find_all('tr', limit=22)
             
             # Get column indices
             headers = [th.text.strip() for th in rows[0].find_all('th')]
@@ -2424,18 +2046,14 @@ async def get_race_victory_table(race_id: int) -> str:
             max_rows = min(21, len(rows))
             
             for i, row in enumerate(rows[1:max_rows]):
-                cols = row.find_all('td')
+                cols = _row_texts(row)
                 if len(cols) < 2:  # Ensure it's a data row
                     continue
                 
                 pos = i + 1
-                
-                # Rider name can be in a link
-                rider_col = cols[rider_idx] if rider_idx < len(cols) else None
-                rider = rider_col.text.strip() if rider_col else "N/A"
-                
-                wins = cols[wins_idx].text.strip() if wins_idx < len(cols) else "N/A"
-                years = cols[years_idx].text.strip() if years_idx < len(cols) and years_idx < len(cols) else ""
+                rider = cols[rider_idx] if rider_idx < len(cols) else "N/A"
+                wins = cols[wins_idx] if wins_idx < len(cols) else "N/A"
+                years = cols[years_idx] if years_idx < len(cols) else ""
                 
                 result_line = f"{pos}. {rider}: {wins} win"
                 if wins != '1':
@@ -2444,12 +2062,12 @@ async def get_race_victory_table(race_id: int) -> str:
                 if years:
                     result_line += f" ({years})"
                 
-                info += result_line + "\n"
+                parts.append(result_line + "\n")
             
             if len(rows) > 21:
-                info += "...\n"
+                parts.append("...\n")
         
-        return info
+        return "".join(parts)
     except Exception as e:
         return f"Error retrieving victory table for race ID {race_id}: {str(e)}"
 
@@ -2502,7 +2120,8 @@ async def get_uci_rankings(rank_type: str = "riders", category: str = "world", y
         }
         
         # Get the parameter values
-        h = h_params.get(rank_type.lower(), 1)  # Default to riders
+        rank_key = rank_type.lower()
+        h = h_params.get(rank_key, 1)  # Default to riders
         rank = rank_params.get(category.lower(), 1)  # Default to world
         
         # Create parameters dict
@@ -2520,10 +2139,10 @@ async def get_uci_rankings(rank_type: str = "riders", category: str = "world", y
             params["cnat"] = country_code.upper()
         
         # Get rankings
-        rankings = Ranking(**params)
+        rankings = await asyncio.to_thread(Ranking, **params)
         
         # Build information string
-        info = ""
+        parts = []
         
         # Format title
         category_name = category.capitalize()
@@ -2533,11 +2152,11 @@ async def get_uci_rankings(rank_type: str = "riders", category: str = "world", y
         year_str = str(year) if year else "Current"
         
         # Build title
-        info += f"UCI {category_name} {rank_type_name} Rankings - {year_str}"
+        parts.append(f"UCI {category_name} {rank_type_name} Rankings - {year_str}")
         if country_code:
-            info += f" ({country_code.upper()})"
+            parts.append(f" ({country_code.upper()})")
         
-        info += f" - Page {page_num}:\n\n"
+        parts.append(f" - Page {page_num}:\n\n")
         
         # Check if we can parse the data
         if not hasattr(rankings, 'soup') or not rankings.soup:
@@ -2558,10 +2177,11 @@ async def get_uci_rankings(rank_type: str = "riders", category: str = "world", y
         if not rankings_table:
             # Try to find any table with ranking-like structure
             for table in tables:
-                rows = table.find_all('tr')
+                # Stop scanning rows as soon as we have enough to classify the table
+                rows = table.find_all('tr', limit=3)
                 if len(rows) >= 3:  # Header + at least 2 data rows
                     # Check if first cell might be a position/rank
-                    first_row_cols = rows[1].find_all('td')
+                    first_row_cols = rows[1].find_all('td', limit=3)
                     if len(first_row_cols) >= 3 and first_row_cols[0].text.strip().isdigit():
                         rankings_table = table
                         break
@@ -2575,70 +2195,30 @@ async def get_uci_rankings(rank_type: str = "riders", category: str = "world", y
         # Get headers to determine column positions
         headers = [th.text.strip() for th in rows[0].find_all('th')] if rows[0].find_all('th') else []
         
-        # Find column indices based on rank type
-        if rank_type.lower() == "riders":
-            pos_idx = next((i for i, h in enumerate(headers) if "Rank" in h or "Pos" in h), 0)
-            name_idx = next((i for i, h in enumerate(headers) if "Rider" in h or "Name" in h), 1)
-            team_idx = next((i for i, h in enumerate(headers) if "Team" in h), 2)
-            points_idx = next((i for i, h in enumerate(headers) if "Points" in h), 3)
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                pos = cols[pos_idx].text.strip() if pos_idx < len(cols) else "N/A"
-                name = cols[name_idx].text.strip() if name_idx < len(cols) else "N/A"
-                team = cols[team_idx].text.strip() if team_idx < len(cols) and team_idx < len(cols) else "N/A"
-                points = cols[points_idx].text.strip() if points_idx < len(cols) and points_idx < len(cols) else "N/A"
-                
-                info += f"{pos}. {name} ({team}): {points} pts\n"
+        # Find column indices based on rank type (defaults to riders, like h above)
+        column_keywords, format_line = _RANK_SPEC.get(rank_key, _RANK_SPEC["riders"])
+        indices = _column_indices(headers, column_keywords, defaults=range(len(column_keywords)))
         
-        elif rank_type.lower() == "teams":
-            pos_idx = next((i for i, h in enumerate(headers) if "Rank" in h or "Pos" in h), 0)
-            team_idx = next((i for i, h in enumerate(headers) if "Team" in h), 1)
-            points_idx = next((i for i, h in enumerate(headers) if "Points" in h), 2)
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                pos = cols[pos_idx].text.strip() if pos_idx < len(cols) else "N/A"
-                team = cols[team_idx].text.strip() if team_idx < len(cols) else "N/A"
-                points = cols[points_idx].text.strip() if points_idx < len(cols) and points_idx < len(cols) else "N/A"
-                
-                info += f"{pos}. {team}: {points} pts\n"
-        
-        elif rank_type.lower() == "nations":
-            pos_idx = next((i for i, h in enumerate(headers) if "Rank" in h or "Pos" in h), 0)
-            nation_idx = next((i for i, h in enumerate(headers) if "Nation" in h or "Country" in h), 1)
-            points_idx = next((i for i, h in enumerate(headers) if "Points" in h), 2)
+        # Skip header row
+        for row in rows[1:]:
+            cols = _row_texts(row)
+            if len(cols) < 3:  # Ensure it's a data row
+                continue
             
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) < 3:  # Ensure it's a data row
-                    continue
-                
-                pos = cols[pos_idx].text.strip() if pos_idx < len(cols) else "N/A"
-                nation = cols[nation_idx].text.strip() if nation_idx < len(cols) else "N/A"
-                points = cols[points_idx].text.strip() if points_idx < len(cols) and points_idx < len(cols) else "N/A"
-                
-                info += f"{pos}. {nation}: {points} pts\n"
+            values = [cols[i] if i < len(cols) else "N/A" for i in indices]
+            parts.append(format_line(values) + "\n")
         
         # Include pagination info if available
         pagination = soup.find('div', class_='pagination')
         if pagination:
-            info += "\n"
+            parts.append("\n")
             # Find the last page number if available
             last_page_link = pagination.find_all('a')[-1] if pagination.find_all('a') else None
             if last_page_link and last_page_link.text.strip().isdigit():
                 total_pages = int(last_page_link.text.strip())
-                info += f"Page {page_num} of {total_pages}\n"
+                parts.append(f"Page {page_num} of {total_pages}\n")
         
+        info = "".join(parts)
         if info.count('\n') <= 2:  # Only contains title and maybe pagination info
             return f"No rankings data found for the specified parameters."
             
@@ -0,0 +1,254 @@
+"""Direct-HTML fallback parsers for the FirstCycling MCP tools.
+
+These run when the FirstCyclingAPI endpoint objects come back without a
+results table. They are plain functions over the raw page bytes.
+"""
+
+import io
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+import lxml.html
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Victory count shown on rider pages, e.g. "12 UCI victories"
+_UCI_VICTORIES_RE = re.compile(rb'(\d+)\s+UCI\s+victories', re.IGNORECASE)
+
+# A four-digit year inside a date or year cell, e.g. "01.01.2023" or "2023-01-01"
+_YEAR_PATTERN = r'((?:19|20)\d{2})'
+
+# Race history columns and the header keywords that identify them
+_RACE_HISTORY_COLUMNS = (
+    ("Date", ("Date",)),
+    ("Race", ("Race",)),
+    ("Pos", ("Pos", "Result")),
+    ("CAT", ("CAT", "Category")),
+)
+
+_GRAND_TOURS = ("Tour de France", "Giro d'Italia", "Vuelta a España")
+# Matches a race name containing any Grand Tour
+_GRAND_TOUR_PATTERN = '|'.join(re.escape(gt) for gt in _GRAND_TOURS)
+
+
+def parse_rider_info_html(html: bytes, rider_id: int) -> str:
+    """Build the get_rider_info text from a raw rider page.
+
+    Args:
+        html (bytes): The rider page as returned by firstcycling.com.
+        rider_id (int): The rider's ID, used when the page has no name heading.
+
+    Returns:
+        str: The formatted rider information, or a message if the rider does not exist.
+    """
+    # Parse the HTML straight into an lxml tree so lookups run as C-level XPath
+    root = lxml.html.fromstring(html)
+
+    # Check if the page indicates the rider doesn't exist
+    page_text: str = root.text_content().lower()
+    if "not found" in page_text or "no results found" in page_text:
+        return f"Rider ID {rider_id} does not exist on FirstCycling.com."
+
+    # Build rider information string
+    parts: List[str] = []
+
+    # Get rider name from the heading
+    name_element = root.find('.//h1')
+    if name_element is not None:
+        rider_name: str = name_element.text_content().strip()
+        parts.append(f"Name: {rider_name}\n")
+    else:
+        parts.append(f"Rider ID: {rider_id}\n")
+
+    # Get current team - typically in a div after the rider name
+    team_element = next((el for el in root.find_class('blue') if el.tag == 'span'), None)
+    if team_element is not None:
+        team_name: str = team_element.text_content().strip()
+        parts.append(f"Team: {team_name}\n")
+
+    # Try to find the sidebar details (nationality, birth date, etc.)
+    sidebar = next((el for el in root.find_class('rp-info') if el.tag == 'div'), None)
+    if sidebar is not None:
+        for row in sidebar.iter('tr'):
+            cells = row.xpath('.//td')
+            if len(cells) >= 2:
+                key: str = cells[0].text_content().strip().rstrip(':')
+                value: str = cells[1].text_content().strip()
+                if key and value:
+                    parts.append(f"{key}: {value}\n")
+
+    # Look for a table that has race results
+    results_table = None
+    headers: List[str] = []
+    for table in root.iter('table'):
+        headers = [th.text_content().strip() for th in table.iter('th')]
+        if len(headers) >= 3 and ('Date' in headers or 'Race' in headers):
+            results_table = table
+            break
+
+    if results_table is not None:
+        # Use the headers to identify column positions
+        date_idx: Optional[int] = headers.index('Date') if 'Date' in headers else None
+        race_idx: Optional[int] = headers.index('Race') if 'Race' in headers else None
+        pos_idx: Optional[int] = headers.index('Pos') if 'Pos' in headers else None
+
+        if date_idx is not None and race_idx is not None and pos_idx is not None:
+            # Up to 5 data rows wide enough for all three columns (header rows only hold <th>),
+            # pulled out one whole column per XPath query
+            row_path: str = f'(.//tr[count(td) > {max(date_idx, race_idx, pos_idx)}])[position() <= 5]'
+            dates, races, positions = (
+                [td.text_content().strip() for td in results_table.xpath(f'{row_path}/td[{idx + 1}]')]
+                for idx in (date_idx, race_idx, pos_idx)
+            )
+
+            if dates:
+                parts.append("\nRecent Results:\n")
+                for i, (date, race, pos) in enumerate(zip(dates, races, positions), 1):
+                    parts.append(f"{i}. {date} - {race}: {pos}\n")
+
+    # Try to find victories count
+    # It can be in any section of the page, so scan the raw bytes instead of the tree
+    victory_match = _UCI_VICTORIES_RE.search(html)
+    if victory_match:
+        parts.append(f"\nUCI Victories: {victory_match.group(1).decode()}\n")
+
+    return "".join(parts)
+
+
+class _TextConverters(defaultdict):
+    """``read_html`` converters that keep every column's cells as text.
+
+    Unlike ``defaultdict(lambda: str)`` it does not store the columns it is
+    asked for, so one instance can serve every table of a page.
+    """
+
+    def __missing__(self, key: object) -> type:
+        return str
+
+
+def _read_tables(html: bytes) -> List['pd.DataFrame']:
+    """Read every table of a raw page into a DataFrame of cell text.
+
+    No cell is converted, so dates such as ``01.05`` and positions keep the
+    page's text. Blank cells are empty strings.
+
+    Args:
+        html (bytes): The page as returned by firstcycling.com.
+
+    Returns:
+        List[pd.DataFrame]: One DataFrame per table, in page order.
+    """
+    import pandas as pd
+
+    try:
+        return pd.read_html(io.BytesIO(html), flavor='lxml', converters=_TextConverters(), keep_default_na=False)
+    except ValueError:  # Raised when the page has no tables
+        return []
+
+
+def _race_tables(html: bytes) -> Iterator['pd.DataFrame']:
+    """Yield the tables of a raw page with the race columns given standard names.
+
+    A second ``Race`` column, which holds the race name after the flag column,
+    becomes ``Race``; a ``Date`` header spanning a year and a day column names
+    them ``Year`` and ``Date``. The first header containing each keyword of
+    ``_RACE_HISTORY_COLUMNS`` is renamed to that column's name.
+    """
+    for table_df in _read_tables(html):
+        # As in parse_table, a second "Race" column holds the race name after the flag column
+        if 'Race.1' in table_df:
+            table_df = table_df.rename(columns={'Race': 'Race_Country', 'Race.1': 'Race'})
+        # Likewise a "Date" header spanning two columns covers the year and then the day
+        if 'Date.1' in table_df and 'Year' not in table_df:
+            table_df = table_df.rename(columns={'Date': 'Year', 'Date.1': 'Date'})
+
+        # Map the first header containing each keyword onto the standard column name
+        headers: List[str] = [str(column) for column in table_df.columns]
+        renames: Dict[str, str] = {}
+        for name, keywords in _RACE_HISTORY_COLUMNS:
+            if name in headers:
+                continue
+            match = next((h for h in headers if h not in renames and any(k in h for k in keywords)), None)
+            if match is not None:
+                renames[match] = name
+        yield table_df.set_axis(headers, axis=1).rename(columns=renames)
+
+
+def _with_years(table_df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Give a race table an integer ``Year`` column, dropping rows without a year.
+
+    The year comes from the ``Year`` column when the table has one, otherwise
+    from the dates.
+    """
+    year_source = table_df['Year'] if 'Year' in table_df else table_df['Date']
+    years = year_source.astype(str).str.extract(_YEAR_PATTERN, expand=False)
+    table_df = table_df.assign(Year=years).dropna(subset=['Year'])
+    return table_df.astype({'Year': int}).fillna('')
+
+
+def parse_race_history_html(html: bytes) -> Optional['pd.DataFrame']:
+    """Read the race history table of a raw rider page into a DataFrame.
+
+    The first table with date and race columns is used. Its position and
+    category columns are renamed to ``Pos`` and ``CAT``, and a ``Year``
+    column is taken from the dates when the table has none; rows without a
+    year are dropped.
+
+    Args:
+        html (bytes): The page as returned by firstcycling.com.
+
+    Returns:
+        Optional[pd.DataFrame]: The race rows, or None if the page has no race table.
+    """
+    for table_df in _race_tables(html):
+        if 'Date' in table_df and 'Race' in table_df:
+            return _with_years(table_df)
+
+    return None
+
+
+def parse_race_results_html(html: bytes) -> Optional['pd.DataFrame']:
+    """Read the race results table of a raw rider one-day or stage race page.
+
+    Like :func:`parse_race_history_html`, but a table with a year column and
+    no dates is also accepted; its ``Date`` column is then filled with
+    ``'N/A'``.
+
+    Args:
+        html (bytes): The page as returned by firstcycling.com.
+
+    Returns:
+        Optional[pd.DataFrame]: The race rows, or None if the page has no race table.
+    """
+    for table_df in _race_tables(html):
+        if 'Race' in table_df and ('Date' in table_df or 'Year' in table_df):
+            if 'Date' not in table_df:
+                table_df = table_df.assign(Date='N/A')
+            return _with_years(table_df)
+
+    return None
+
+
+def parse_grand_tour_html(html: bytes) -> Optional['pd.DataFrame']:
+    """Find the Grand Tour rows on a raw rider Grand Tour page.
+
+    Args:
+        html (bytes): The page as returned by firstcycling.com.
+
+    Returns:
+        Optional[pd.DataFrame]: The Grand Tour rows of the first table that lists
+        any, with the race columns named as by :func:`_race_tables`, or None if
+        none is found.
+    """
+    # Keep the Grand Tour rows of the first table that lists any
+    for table_df in _race_tables(html):
+        if 'Race' not in table_df:
+            continue
+
+        is_grand_tour = table_df['Race'].astype(str).str.contains(_GRAND_TOUR_PATTERN)
+        if is_grand_tour.any():
+            return table_df[is_grand_tour]
+
+    return None
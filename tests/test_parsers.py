@@ -0,0 +1,120 @@
+from firstcycling_parsers import (
+    parse_rider_info_html,
+    parse_race_history_html,
+    parse_race_results_html,
+    parse_grand_tour_html,
+)
+import os
+
+# Update path for fixtures
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# A rider page with a results table, in the markup firstcycling.com uses
+RIDER_PAGE = b"""<html><head><title>Mathieu van der Poel | FirstCycling</title></head><body>
+<h1>Mathieu van der Poel</h1>
+<span class="blue">Alpecin-Deceuninck</span>
+<div class="rp-info"><table>
+  <tr><td>Nationality:</td><td>Netherlands</td></tr>
+  <tr><td>Date of Birth:</td><td>19.01.1995</td></tr>
+</table></div>
+<table>
+  <tr><th>Date</th><th>Race</th><th>Pos</th></tr>
+  <tr><td>13.04</td><td>Paris-Roubaix</td><td>1</td></tr>
+  <tr><td>06.04</td><td>Tour of Flanders</td><td>3</td></tr>
+</table>
+<p>56 UCI victories</p>
+</body></html>"""
+
+# A Grand Tour page; the blank Pos cell would make type-guessing read positions as floats
+GRAND_TOUR_PAGE = b"""<html><body><table class="tablesorter">
+  <thead><tr><th>Year</th><th colspan="2">Race</th><th>Pos</th><th>Time</th></tr></thead>
+  <tbody>
+    <tr><td>2023</td><td><span class="flag flag-fr"></span></td><td><a>Tour de France</a></td><td>2</td><td>+ 07:29</td></tr>
+    <tr><td>2022</td><td></td><td>Tour de France</td><td></td><td></td></tr>
+    <tr><td>2021</td><td></td><td>Giro d'Italia</td><td>12</td><td></td></tr>
+    <tr><td>2021</td><td></td><td>Tour of Britain</td><td>1</td><td></td></tr>
+  </tbody>
+</table></body></html>"""
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_PATH, name), 'rb') as f:
+        return f.read()
+
+def test_parse_rider_info_html():
+    assert parse_rider_info_html(RIDER_PAGE, 16672) == (
+        "Name: Mathieu van der Poel\n"
+        "Team: Alpecin-Deceuninck\n"
+        "Nationality: Netherlands\n"
+        "Date of Birth: 19.01.1995\n"
+        "\nRecent Results:\n"
+        "1. 13.04 - Paris-Roubaix: 1\n"
+        "2. 06.04 - Tour of Flanders: 3\n"
+        "\nUCI Victories: 56\n"
+    )
+
+def test_parse_rider_info_html_fixture():
+    assert parse_rider_info_html(load_fixture('mvdp_victories.html'), 16672) == "Name: Mathieu van der Poel\n"
+
+def test_parse_rider_info_html_missing_rider():
+    page = b"<html><body><p>Rider not found</p></body></html>"
+    assert parse_rider_info_html(page, 1) == "Rider ID 1 does not exist on FirstCycling.com."
+
+def test_parse_race_history_html():
+    results_df = parse_race_history_html(load_fixture('mvdp_victories.html'))
+
+    assert len(results_df) == 286
+    # Dates keep the page text, and the year comes from the first column of the "Date" header
+    assert results_df[['Year', 'Date', 'Race', 'CAT']].head(3).values.tolist() == [
+        [2012, '22.04', 'EPZ Omloop van Borsele Juniors', 'Jr'],
+        [2012, '24.06', 'Acht van Bladel Juniors', 'Jr'],
+        [2012, '04.07', 'Harze', 'Jr'],
+    ]
+    assert results_df['Race'].iloc[-1] == "Tour de Luxembourg  |  1st stage"
+
+def test_parse_race_history_html_without_table():
+    assert parse_race_history_html(b"<html><body><p>No data</p></body></html>") is None
+
+def test_parse_race_results_html():
+    results_df = parse_race_results_html(load_fixture('mvdp_victories.html'))
+
+    assert results_df[['Year', 'Date', 'Race', 'CAT']].iloc[4].tolist() == [
+        2012, '01.09', 'Course de côte Herbeumont Juniors', 'Jr'
+    ]
+
+def test_parse_race_results_html_year_only():
+    page = b"""<html><body><table>
+      <tr><th>Year</th><th>Race</th><th>Pos</th><th>CAT</th></tr>
+      <tr><td>2024</td><td>Paris-Roubaix</td><td>1</td><td>1.UWT</td></tr>
+      <tr><td>2019</td><td>Amstel Gold Race</td><td></td><td>1.UWT</td></tr>
+    </table></body></html>"""
+    results_df = parse_race_results_html(page)
+
+    assert results_df[['Year', 'Date', 'Race', 'Pos', 'CAT']].values.tolist() == [
+        [2024, 'N/A', 'Paris-Roubaix', '1', '1.UWT'],
+        [2019, 'N/A', 'Amstel Gold Race', '', '1.UWT'],
+    ]
+
+def test_parse_grand_tour_html():
+    results_df = parse_grand_tour_html(GRAND_TOUR_PAGE)
+
+    assert results_df[['Year', 'Race', 'Pos', 'Time']].values.tolist() == [
+        ['2023', 'Tour de France', '2', '+ 07:29'],
+        ['2022', 'Tour de France', '', ''],
+        ['2021', "Giro d'Italia", '12', ''],
+    ]
+
+def test_parse_grand_tour_html_fixture():
+    results_df = parse_grand_tour_html(load_fixture('mvdp_victories.html'))
+
+    # The year is the first column of the "Date" header, the day the second
+    assert results_df[['Year', 'Date', 'Race', 'CAT']].values.tolist() == [
+        ['2021', '27.06', 'Tour de France  |  2nd stage', '2.UWT'],
+        ['2022', '06.05', "Giro d'Italia  |  1st stage", '2.UWT'],
+    ]
+
+def test_parse_grand_tour_html_without_grand_tours():
+    page = b"""<html><body><table>
+      <tr><th>Year</th><th>Race</th><th>Pos</th></tr>
+      <tr><td>2021</td><td>Tour of Britain</td><td>1</td></tr>
+    </table></body></html>"""
+    assert parse_grand_tour_html(page) is None